@@ -0,0 +1,54 @@
+import random
+import string
+import timeit
+
+import numpy as np
+
+from Benchmarks.Board import random_row
+from Config import CanvasConfig
+from Wordle.Canvas import Canvas, Drawing
+from Wordle.Canvas.Glyph import GlyphColor, GlyphShape
+
+
+def drawings() -> list:
+    """ Every glyph, characters outside the alphabet, boards and the keyboard """
+    alphabet = ' ' + string.digits + string.ascii_letters + string.punctuation
+    rows = [tuple((char, color) for char in alphabet[i:i + 10])
+            for color in GlyphColor for i in range(0, len(alphabet), 10)]
+    rows.append(tuple((char, GlyphColor.GREEN) for char in 'é€\t✓'))
+
+    result = [Drawing(rows=(row,), shape=shape) for row in rows for shape in GlyphShape]
+    for length in [2, 5, 11]:
+        for count in [2, 6, 10]:
+            result.append(Drawing(rows=tuple(tuple(random_row(length)) for _ in range(count))))
+
+    keyboard = [tuple((char, random.choice(list(GlyphColor))) for char in row)
+                for row in ['QWERTYUIOP', 'ASDFGHJKL', 'ZXCVBNM ']]
+    result.append(Drawing(rows=tuple(keyboard), shape=GlyphShape.WIDE))
+    return result
+
+
+def main():
+    backends = {name: Canvas(CanvasConfig(backend=name, row_cache_bytes=0))
+                for name in ['pil', 'numpy']}
+
+    for drawing in drawings():
+        expected, actual = (np.asarray(canvas.render(drawing).image) for canvas in backends.values())
+        assert expected.shape == actual.shape and (expected == actual).all(), drawing
+    print(f'{len(drawings())} drawings pixel-identical')
+
+    row = [Drawing(rows=(tuple(random_row(5)),)) for _ in range(50)]
+    board = [Drawing(rows=tuple(tuple(random_row(5)) for _ in range(6))) for _ in range(50)]
+
+    for name, canvas in backends.items():
+        draw = min(timeit.repeat(lambda: [canvas.render(d) for d in row], number=5, repeat=3)) / 250
+        join = min(timeit.repeat(lambda: [canvas.render(d) for d in board], number=5, repeat=3)) / 250
+        encode = min(timeit.repeat(
+            lambda: [canvas.render(d).encode() for d in board], number=1, repeat=3)) / 50
+
+        print(f'  {name:<6} row {draw * 1e6:7.1f} us  6 row board {join * 1e6:7.1f} us  '
+              f'board with encode {encode * 1e3:5.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+import random
+import string
+import time
+
+from Config import CanvasConfig
+from Wordle.Canvas import Canvas
+from Wordle.Canvas.Glyph import GlyphColor
+
+
+def random_row(length: int) -> list:
+    colors = [GlyphColor.GREEN, GlyphColor.YELLOW, GlyphColor.INVERSE_LIGHT_GRAY]
+    return [(random.choice(string.ascii_uppercase), random.choice(colors))
+            for _ in range(length)]
+
+
+def time_guesses(canvas: Canvas, length: int, guesses: int, board: bool, games: int = 200) -> list:
+    """ Seconds spent on the nth guess: drawing the row and exporting the progress image """
+    totals = [0.0] * guesses
+    for _ in range(games):
+        rows = [random_row(length) for _ in range(guesses)]
+        progress = canvas.create_board(columns=length, rows=6) if board else None
+
+        for n, row in enumerate(rows):
+            start = time.perf_counter()
+            image = canvas.draw_word(row)
+            if board:
+                progress.append(image)
+                progress.export()
+            else:
+                progress = image if progress is None else canvas.vertical_join([progress, image])
+            totals[n] += time.perf_counter() - start
+
+    return [total / games for total in totals]
+
+
+def main():
+    canvas = Canvas(CanvasConfig())
+    guesses = 20
+    checkpoints = [1, 2, 6, 10, 15, 20]
+
+    for length in [5, 10]:
+        # Warm the glyph collection
+        time_guesses(canvas, length, guesses, board=True, games=2)
+
+        joined = time_guesses(canvas, length, guesses, board=False)
+        board = time_guesses(canvas, length, guesses, board=True)
+
+        print(f'{length} letters, ms per guess')
+        print('  guess  ' + ''.join(f'{n:>8}' for n in checkpoints))
+        print('  join   ' + ''.join(f'{joined[n - 1] * 1e3:8.2f}' for n in checkpoints))
+        print('  board  ' + ''.join(f'{board[n - 1] * 1e3:8.2f}' for n in checkpoints))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import os
+import random
+import string
+from typing import Tuple
+
+from Wordle.Game import Game
+from Wordle.Words import Words
+from Wordle.WordsService import WordsService
+
+
+def create_database(directory: str, size: int, lengths: Tuple[int, int] = (5, 5)):
+    """ Seeds a wordle.db of random words in directory and points Words at it """
+    Words.DATABASE = os.path.join(directory, 'wordle.db')
+    Words.WORDLIST = os.path.join(directory, 'wordlist.txt')
+
+    with open(Words.WORDLIST, 'w') as wordlist:
+        for _ in range(size):
+            word = ''.join(random.choices(string.ascii_lowercase, k=random.randint(*lengths)))
+            wordlist.write(f'{word}\tA synthetic definition.\n')
+
+    Words.create_db()
+    Words.seed()
+
+
+async def create_games(count: int, guesses: int) -> list[Game]:
+    words = WordsService(pool_size=0)
+
+    games = []
+    for _ in range(count):
+        game = Game(mode=Game.EASY, words=words)
+        await game.generate_target(word_length=5, mode=Game.EASY)
+        for word in Words.get_random(5, guesses):
+            await game.guess(word.word, author_id=0)
+        games.append(game)
+
+    return games
+
+
+def channel(channel_id: int):
+    """ Just enough of a discord TextChannel for GameManager """
+    return type('Channel', (), {'id': channel_id, 'guild': type('Guild', (), {'id': 0})()})()
+
+
+class Context:
+    """ Just enough of discord's Context for the cog; sending is free """
+
+    def __init__(self, channel_id: int):
+        self.message = type('Message', (), {'channel': channel(channel_id)})()
+        self.author = type('Author', (), {'id': 1})()
+
+    async def send(self, content=None, **kwargs):
+        if 'file' in kwargs:
+            kwargs['file'].fp.read()
@@ -0,0 +1,38 @@
+import asyncio
+import gc
+import pickle
+import tempfile
+import tracemalloc
+
+from Benchmarks.Fixtures import create_database, create_games
+from Wordle.Words import Words
+
+
+def main():
+    count, guesses = 200, 4
+
+    with tempfile.TemporaryDirectory() as directory:
+        create_database(directory, 10_000)
+        Words.load()
+
+        # Warm the solver so it is not counted
+        asyncio.run(create_games(1, guesses))
+
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        games = asyncio.run(create_games(count, guesses))
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    pickled = sum(len(pickle.dumps(game)) for game in games)
+
+    print(f'{count} games with {guesses} guesses each')
+    print(f'  in memory: {size / count:10.0f} bytes per game')
+    print(f'  pickled:   {pickled / count:10.0f} bytes per game')
+
+
+if __name__ == '__main__':
+    main()
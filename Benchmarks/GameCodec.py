@@ -0,0 +1,38 @@
+import asyncio
+import tempfile
+import timeit
+
+from Benchmarks.Fixtures import create_database, create_games
+from Wordle.Store.Redis import CompactCodec, PickleCodec
+from Wordle.Store.Redis.GameCodec import lz4
+from Wordle.Words import Words
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        create_database(directory, 10_000)
+        Words.load()
+
+        codecs = {
+            'pickle': PickleCodec(),
+            'compact': CompactCodec(),
+            'compact+zlib': CompactCodec(compression='zlib', min_size=0),
+        }
+        if lz4 is not None:
+            codecs['compact+lz4'] = CompactCodec(compression='lz4', min_size=0)
+
+        for guesses in [0, 3, 6]:
+            game = asyncio.run(create_games(1, guesses))[0]
+            print(f'game with {guesses} guesses')
+
+            for name, codec in codecs.items():
+                data = codec.encode(game)
+                encode = min(timeit.repeat(lambda: codec.encode(game), number=2000, repeat=3)) / 2000
+                decode = min(timeit.repeat(lambda: codec.decode(data), number=2000, repeat=3)) / 2000
+
+                print(f'  {name:<13} {len(data):6} bytes  '
+                      f'encode {encode * 1e6:6.1f} us  decode {decode * 1e6:6.1f} us')
+
+
+if __name__ == '__main__':
+    main()
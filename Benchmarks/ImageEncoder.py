@@ -0,0 +1,42 @@
+import timeit
+
+from PIL import features
+
+from Benchmarks.Board import random_row
+from Config import CanvasConfig, EncodingConfig
+from Wordle.Canvas import Canvas, ImageEncoder
+
+
+def main():
+    canvas = Canvas(CanvasConfig(row_cache_bytes=0))
+    boards = [canvas.vertical_join([canvas.draw_word(random_row(5)) for _ in range(6)]).image
+              for _ in range(10)]
+
+    encoders = {
+        'png rgba': EncodingConfig(palette=False),
+        'png rgba level 1': EncodingConfig(palette=False, compress_level=1),
+        'png palette': EncodingConfig(),
+        'png palette level 1': EncodingConfig(compress_level=1),
+        'png palette level 9': EncodingConfig(compress_level=9),
+    }
+    if features.check('webp'):
+        encoders.update({
+            'webp lossless': EncodingConfig(format='webp'),
+            'webp lossless m4': EncodingConfig(format='webp', method=4),
+            'webp q90': EncodingConfig(format='webp', lossless=False),
+        })
+    else:
+        print('Pillow was built without webp support, skipping webp')
+
+    print(f'5 letter, 6 guess board ({boards[0].width}x{boards[0].height})')
+    for name, config in encoders.items():
+        encoder = ImageEncoder(config)
+        size = sum(len(encoder.encode(board)) for board in boards) / len(boards)
+        seconds = min(timeit.repeat(
+            lambda: [encoder.encode(board) for board in boards], number=5, repeat=3)) / (5 * len(boards))
+
+        print(f'  {name:<20} {seconds * 1e3:6.2f} ms  {size:8.0f} bytes')
+
+
+if __name__ == '__main__':
+    main()
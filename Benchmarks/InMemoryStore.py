@@ -0,0 +1,61 @@
+import asyncio
+import tempfile
+import time
+
+import fakeredis
+import fakeredis.aioredis
+from aioredis import ConnectionPool
+
+from Benchmarks.Fixtures import create_database, create_games
+from Wordle.RedisClient import RedisClient
+from Wordle.Store import InMemoryStore, RedisStore
+from Wordle.Words import Words
+
+
+async def abandon(store: InMemoryStore, game, count: int) -> float:
+    """ Starts count games that nobody finishes, one channel each """
+    start = time.perf_counter()
+    for channel_id in range(count):
+        await store.add_game(channel_id % 100, channel_id, game)
+        game = await store.get_game(channel_id % 100, channel_id)
+    return (time.perf_counter() - start) / count
+
+
+async def run():
+    game = (await create_games(1, 3))[0]
+    count = 100_000
+
+    print(f'{count} abandoned games')
+    for name, store in [('unbounded', InMemoryStore()),
+                        ('max 10000', InMemoryStore(max_games=10_000)),
+                        ('ttl', InMemoryStore(ttl=0.05))]:
+        per_game = await abandon(store, game, count)
+
+        await asyncio.sleep(0.05)
+        start = time.perf_counter()
+        swept = store.sweep(1000)
+        batch = time.perf_counter() - start
+        swept += store.sweep()
+
+        print(f'  {name:<10} add+get {per_game * 1e6:5.1f} us  swept {swept}, '
+              f'{batch * 1e3:4.1f} ms per batch of 1000  {store}  {len(store.games)} servers')
+
+    pool = ConnectionPool(server=fakeredis.FakeServer(),
+                          connection_class=fakeredis.aioredis.FakeConnection)
+    store = RedisStore(RedisClient(connection_pool=pool), ttl=3600)
+    await store.add_game(0, 1, game)
+    await store.commit_game(0, 1, await store.get_game(0, 1))
+    ttls = [await store.client.ttl(store.path(0, 1, key)) for key in ['game', 'version']]
+    assert all(0 < ttl <= 3600 for ttl in ttls), ttls
+    print(f'redis game and version keys expire in {ttls} seconds after a commit')
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        create_database(directory, 10_000)
+        Words.load()
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    main()
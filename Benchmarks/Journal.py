@@ -0,0 +1,157 @@
+import asyncio
+import copy
+import os
+import tempfile
+import time
+import timeit
+from typing import Optional
+
+from Benchmarks.Fixtures import channel, create_database, create_games
+from Wordle.GameManager import GameManager
+from Wordle.Store import InMemoryStore
+from Wordle.Store.InMemory import Journal
+from Wordle.Words import Words
+from Wordle.WordsService import WordsService
+
+
+async def guesses(directory: Optional[str] = None) -> float:
+    """ Mean seconds per guess over 20 channels x 10 guesses, flushing in the background """
+    journal = Journal(directory) if directory else None
+    store = InMemoryStore(journal=journal)
+    games = GameManager(store, WordsService(pool_size=0))
+    flusher = asyncio.get_running_loop().create_task(journal.run(store.items)) if journal else None
+
+    targets = set()
+    for channel_id in range(20):
+        game = await games.add_game(channel(channel_id), await games.create_game(5, 'easy'))
+        targets.add(game.target.word)
+    words = [word.word for word in Words.get_random(5, 30) if word.word not in targets][:10]
+
+    elapsed = 0
+    for word in words:
+        for channel_id in range(20):
+            start = time.perf_counter()
+            await games.guess(channel(channel_id), word, author_id=0)
+            elapsed += time.perf_counter() - start
+
+            # Guesses arrive as separate messages, giving the flusher a turn
+            await asyncio.sleep(0.001)
+
+    if flusher is not None:
+        flusher.cancel()
+        await journal.flush()
+    return elapsed / 200
+
+
+async def put(directory: str) -> float:
+    """ Seconds to encode and buffer one record """
+    game = (await create_games(1, 3))[0]
+    journal = Journal(directory)
+    return min(timeit.repeat(lambda: journal.put(0, 1, game), number=10_000, repeat=3)) / 10_000
+
+
+class FailingJournal(Journal):
+    """ Fails the next failures writes after writing half their records """
+
+    failures: int = 0
+
+    def _write(self, file, data: bytes):
+        if self.failures:
+            self.failures -= 1
+            file.write(data[:len(data) // 2])
+            file.flush()
+            raise OSError(28, 'No space left on device')
+        super()._write(file, data)
+
+
+async def failures(directory: str):
+    """ Writes that fail midway are retried without losing or tearing records """
+    game = (await create_games(1, 3))[0]
+    journal = FailingJournal(directory)
+    store = InMemoryStore(journal=journal)
+    flusher = asyncio.get_running_loop().create_task(journal.run(store.items, interval=0.001))
+
+    journal.failures = 3
+    for channel_id in range(100):
+        await store.add_game(0, channel_id, copy.copy(game))
+        await asyncio.sleep(0.0005)
+    while journal.failures or journal._pending:
+        await asyncio.sleep(0.001)
+    flusher.cancel()
+
+    restored = InMemoryStore(journal=Journal(directory))
+    assert await restored.recover() == 100
+    assert restored.journal.size == sum(
+        os.path.getsize(journal.log_path(generation)) for generation in journal._generations()
+        if generation < restored.journal.generation)
+    print(f'  recovered every game after 3 failed writes, across {restored.journal.generation} logs '
+          f'of {restored.journal.size} bytes counting towards compaction')
+    restored.journal.close()
+
+
+async def recovery(directory: str, count: int):
+    game = (await create_games(1, 3))[0]
+    store = InMemoryStore(journal=Journal(directory))
+
+    start = time.perf_counter()
+    for channel_id in range(count):
+        await store.add_game(channel_id % 100, channel_id, copy.copy(game))
+        for _ in range(3):
+            await store.update_game(channel_id % 100, channel_id, await store.get_game(channel_id % 100, channel_id))
+    await store.journal.flush()
+    print(f'  logged {store.journal.records} records in {time.perf_counter() - start:.2f} s, '
+          f'{store.journal.size} bytes')
+
+    async def recover(label: str):
+        restored = InMemoryStore(journal=Journal(directory))
+        start = time.perf_counter()
+        count = await restored.recover()
+        elapsed = time.perf_counter() - start
+
+        for channel_id in range(0, len(store), 997):
+            before = await store.get_game(channel_id % 100, channel_id)
+            after = await restored.get_game(channel_id % 100, channel_id)
+            assert (before.version, before.guesses) == (after.version, after.guesses)
+        assert count == len(store), (count, len(store))
+
+        print(f'  recovered {count} games from {label} in {elapsed:.2f} s')
+        restored.journal.close()
+
+    await recover('the log')
+
+    # A crash mid-write leaves half a record at the end of the log
+    await store.remove_game(0, 100)
+    await store.journal.flush()
+    with open(store.journal.log_path(store.journal.generation), 'ab') as file:
+        file.write(Journal.HEADER.pack(0, Journal.REMOVE, 0, 200, 0, 0)[:10])
+    await recover('the log with a torn tail')
+
+    start = time.perf_counter()
+    await store.journal.compact(store.items())
+    print(f'  compacted into a {os.path.getsize(store.journal.snapshot_path)} byte snapshot '
+          f'in {time.perf_counter() - start:.2f} s')
+    await recover('the snapshot')
+
+
+def main():
+    count = 100_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        create_database(directory, 10_000)
+        Words.load()
+
+        plain = min(asyncio.run(guesses()) for _ in range(3))
+        journaled = min(asyncio.run(guesses(os.path.join(directory, f'guesses{i}'))) for i in range(3))
+        print(f'us per guess: in memory {plain * 1e6:.1f}, journaled {journaled * 1e6:.1f}')
+
+        print(f'us per journal record: {asyncio.run(put(os.path.join(directory, "put"))) * 1e6:.1f}')
+
+        print(f'{count} games')
+        asyncio.run(recovery(os.path.join(directory, 'recovery'), count))
+
+        print('write failures')
+        asyncio.run(failures(os.path.join(directory, 'failures')))
+
+
+if __name__ == '__main__':
+    main()
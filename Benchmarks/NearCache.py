@@ -0,0 +1,194 @@
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from typing import Optional
+
+import fakeredis
+import fakeredis.aioredis
+from aioredis import ConnectionPool
+
+from Benchmarks.Fixtures import channel, create_database
+from Benchmarks.RedisStore import SlowClient
+from Wordle.GameManager import GameManager
+from Wordle.Store import GameConflictError, GameNotAddedError, GameNotFoundError, RedisStore
+from Wordle.Store.Redis import NearCache
+from Wordle.Words import Words
+from Wordle.WordsService import WordsService
+
+
+class ReorderingClient(SlowClient):
+    """ Holds back the reply to the next script call by delay seconds """
+
+    delay: float = 0
+
+    async def execute_command(self, *args, **kwargs):
+        result = await super().execute_command(*args, **kwargs)
+        if args[0] == 'EVALSHA' and ReorderingClient.delay:
+            delay, ReorderingClient.delay = ReorderingClient.delay, 0
+            await asyncio.sleep(delay)
+        return result
+
+
+async def connect(server: fakeredis.FakeServer,
+                  cache: Optional[NearCache],
+                  client: type = SlowClient,
+                  ttl: Optional[int] = None) -> GameManager:
+    pool = ConnectionPool(server=server, connection_class=fakeredis.aioredis.FakeConnection)
+    store = RedisStore(client(connection_pool=pool), cache=cache, ttl=ttl)
+
+    if cache is not None:
+        asyncio.get_running_loop().create_task(store.listen())
+        while not store._listening:
+            await asyncio.sleep(0.001)
+
+    return GameManager(store, WordsService(pool_size=0))
+
+
+async def settle():
+    """ Lets every published write reach the other store's subscriber """
+    for _ in range(5):
+        await asyncio.sleep(0.001)
+
+
+async def check(steps: int):
+    """ Two cached stores playing the same channels must always agree with Redis """
+    server = fakeredis.FakeServer()
+    nodes = [await connect(server, NearCache(8)), await connect(server, NearCache(8))]
+    truth = await connect(server, None)
+    words = [word.word for word in Words.get_random(5, 200)]
+
+    for step in range(steps):
+        node = random.choice(nodes)
+        target = channel(random.randrange(4))
+        action = random.random()
+
+        if action < 0.1:
+            await node.stop_current_game(target)
+        elif action < 0.2:
+            try:
+                await node.add_game(target, await node.create_game(5, 'easy'))
+            except GameNotAddedError:
+                pass
+        else:
+            try:
+                await node.guess(target, random.choice(words), author_id=0)
+            except (GameNotFoundError, GameConflictError):
+                pass
+
+        await settle()
+        for channel_id in range(4):
+            try:
+                expected = await truth.get_current_game(channel(channel_id))
+                expected = (expected.version, expected.guesses)
+            except GameNotFoundError:
+                expected = None
+
+            for other in nodes:
+                try:
+                    actual = await other.get_current_game(channel(channel_id))
+                    actual = (actual.version, actual.guesses)
+                except GameNotFoundError:
+                    actual = None
+                assert actual == expected, (step, channel_id, actual, expected)
+
+    # Racing guessers on both stores must not lose a committed guess
+    target = channel(9)
+    await nodes[0].add_game(target, await nodes[0].create_game(5, 'easy'))
+    committed = 0
+
+    async def guesser(node: GameManager, word: str):
+        nonlocal committed
+        try:
+            await node.guess(target, word, author_id=0)
+            committed += 1
+        except GameConflictError:
+            pass
+
+    await asyncio.gather(*(guesser(nodes[i % 2], word) for i, word in enumerate(words[:40])))
+    game = await truth.get_current_game(target)
+    assert len(game.guesses) == committed == game.version, (len(game.guesses), committed, game.version)
+
+    # Two commits from one store whose replies arrive newest first must
+    # leave the newest game cached
+    node = await connect(server, NearCache(8), ReorderingClient)
+    target = channel(10)
+    await node.add_game(target, await node.create_game(5, 'easy'))
+    first = await node.get_current_game(target)
+    await first.guess(words[0], author_id=0)
+
+    ReorderingClient.delay = 0.02
+    slow = asyncio.get_running_loop().create_task(node.commit_game(target, first))
+    await settle()
+
+    second = await truth.get_current_game(target)
+    await second.guess(words[1], author_id=0)
+    await node.commit_game(target, second)
+    await slow
+
+    actual = await node.get_current_game(target)
+    assert (actual.version, actual.guesses) == (second.version, second.guesses), \
+        (actual.version, second.version)
+
+    # Cached games expire with their keys, whether cached by a commit or a read
+    node, reader = await connect(server, NearCache(8), ttl=1), await connect(server, NearCache(8), ttl=1)
+    target = channel(11)
+    await node.add_game(target, await node.create_game(5, 'easy'))
+    game = await node.get_current_game(target)
+    await game.guess(words[0], author_id=0)
+    await node.commit_game(target, game)
+    await settle()
+    await reader.get_current_game(target)
+
+    await asyncio.sleep(1.1)
+    for other in [node, reader]:
+        try:
+            await other.get_current_game(target)
+            raise AssertionError('cached game outlived its key')
+        except GameNotFoundError:
+            assert other.store.cache.expirations == 1, other.store.cache
+
+    return [node.store.cache for node in nodes]
+
+
+async def reads(cache: Optional[NearCache], rtt: float, count: int) -> list:
+    """ %progress style reads between guesses, all from one store """
+    node = await connect(fakeredis.FakeServer(), cache)
+    target = channel(1)
+    await node.add_game(target, await node.create_game(5, 'easy'))
+    words = [word.word for word in Words.get_random(5, count)]
+
+    latencies = []
+    SlowClient.rtt = rtt
+    for word in words:
+        await node.guess(target, word, author_id=0)
+        for _ in range(3):
+            start = time.perf_counter()
+            await node.get_current_game(target)
+            latencies.append(time.perf_counter() - start)
+    SlowClient.rtt = 0
+
+    return latencies
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        create_database(directory, 10_000)
+        Words.load()
+
+        caches = asyncio.run(check(300))
+        print('two stores agree with Redis after every write over 300 random steps')
+        for cache in caches:
+            print(f'  {cache}')
+
+        print('ms per read, 3 reads after each of 50 guesses, rtt 0.5 ms')
+        for name, cache in [('uncached', None), ('near cache', NearCache(1024))]:
+            latencies = sorted(asyncio.run(reads(cache, 0.0005, 50)))
+            print(f'  {name:<10} p50 {statistics.median(latencies) * 1e3:6.3f}  '
+                  f'p99 {latencies[int(len(latencies) * 0.99)] * 1e3:6.3f}'
+                  + (f'  {cache}' if cache is not None else ''))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+import asyncio
+import statistics
+import tempfile
+import time
+
+import fakeredis
+import fakeredis.aioredis
+from aioredis import ConnectionPool
+
+from Benchmarks.Fixtures import channel, create_database, create_games
+from Wordle.GameManager import GameManager
+from Wordle.RedisClient import RedisClient
+from Wordle.Store import GameConflictError, RedisStore
+from Wordle.Words import Words
+from Wordle.WordsService import WordsService
+
+
+class SlowClient(RedisClient):
+    """ Adds a fixed round trip to every command sent to the fake server """
+
+    rtt: float = 0
+    commands: int = 0
+
+    async def execute_command(self, *args, **kwargs):
+        SlowClient.commands += 1
+        if self.rtt:
+            await asyncio.sleep(self.rtt)
+        return await super().execute_command(*args, **kwargs)
+
+
+async def locked_update(store: RedisStore, channel: int, finish: bool):
+    """ The read-modify-write before versioning: GET, SET XX and a DEL to finish """
+    async with store.lock(0, channel):
+        game = store.codec.decode(await store.client.get(store.path(0, channel, 'game')))
+        await store._set_game(0, channel, game, must_exist=True)
+        if finish:
+            await store.remove_game(0, channel)
+
+
+async def locked_commit(store: RedisStore, channel: int, finish: bool):
+    async with store.lock(0, channel):
+        game = await store.get_game(0, channel)
+        await store.commit_game(0, channel, game, finish=finish)
+
+
+async def locked_guess(games: GameManager, channel, word: str):
+    """ The lock-based %guess """
+    async with games.lock(channel):
+        game = await games.get_current_game(channel)
+        status, _, _ = await game.guess(word, author_id=0)
+        await games.commit_game(channel, game)
+
+
+async def optimistic_guess(games: GameManager, channel, word: str):
+    await games.guess(channel, word, author_id=0)
+
+
+async def contend(flow, guessers: int, guesses: int, rtt: float) -> tuple:
+    """ Guessers in one channel each send their guesses back to back """
+    pool = ConnectionPool(server=fakeredis.FakeServer(),
+                          connection_class=fakeredis.aioredis.FakeConnection)
+    store = RedisStore(SlowClient(connection_pool=pool))
+    games = GameManager(store, WordsService(pool_size=0))
+    target = channel(1)
+
+    game = await games.create_game(5, 'easy')
+    words = [word.word for word in Words.get_random(5, guesses * guessers) if word.word != game.target.word]
+    await games.add_game(target, game)
+
+    latencies = []
+    failures = 0
+
+    async def guesser(words: list):
+        nonlocal failures
+        for word in words:
+            start = time.perf_counter()
+            try:
+                await flow(games, target, word)
+                latencies.append(time.perf_counter() - start)
+            except GameConflictError:
+                failures += 1
+
+    SlowClient.rtt = rtt
+    start = time.perf_counter()
+    await asyncio.gather(*(guesser(words[i::guessers]) for i in range(guessers)))
+    elapsed = time.perf_counter() - start
+    SlowClient.rtt = 0
+
+    committed = len((await store.get_game(0, 1)).guesses)
+    return latencies, failures, len(latencies) / elapsed, committed
+
+
+async def run(flow, rtt: float, rounds: int) -> tuple:
+    pool = ConnectionPool(server=fakeredis.FakeServer(),
+                          connection_class=fakeredis.aioredis.FakeConnection)
+    store = RedisStore(SlowClient(connection_pool=pool))
+    game = (await create_games(1, 3))[0]
+
+    latencies = []
+    commands = 0
+    for channel in range(rounds):
+        await store.add_game(0, channel, game)
+
+        SlowClient.rtt = rtt
+        SlowClient.commands = 0
+        for guess in range(6):
+            start = time.perf_counter()
+            await flow(store, channel, finish=guess == 5)
+            latencies.append(time.perf_counter() - start)
+        SlowClient.rtt = 0
+        commands += SlowClient.commands
+
+    return latencies, commands / len(latencies)
+
+
+def main():
+    rounds = 50
+
+    with tempfile.TemporaryDirectory() as directory:
+        create_database(directory, 10_000)
+        Words.load()
+
+        print(f'ms per guess write over {rounds} games of 6 guesses, lock included')
+        for rtt in [0, 0.0005]:
+            for name, flow in [('get+set+del', locked_update), ('mget+commit', locked_commit)]:
+                latencies, commands = asyncio.run(run(flow, rtt, rounds))
+                latencies.sort()
+                p99 = latencies[int(len(latencies) * 0.99)]
+                print(f'  rtt {rtt * 1e3:3.1f} ms  {name:<12} {commands:4.2f} commands  '
+                      f'p50 {statistics.median(latencies) * 1e3:6.3f}  p99 {p99 * 1e3:6.3f}')
+
+        rtt = 0.0005
+        print(f'concurrent guessers in one channel, 8 guesses each, rtt {rtt * 1e3:3.1f} ms')
+        for guessers in [1, 4, 16]:
+            for name, flow in [('locked', locked_guess), ('optimistic', optimistic_guess)]:
+                latencies, failures, rate, committed = asyncio.run(contend(flow, guessers, 8, rtt))
+                latencies.sort()
+                p99 = latencies[int(len(latencies) * 0.99)]
+                print(f'  {guessers:2} guessers  {name:<10} {rate:7.1f} guesses/s  '
+                      f'p50 {statistics.median(latencies) * 1e3:7.2f} ms  p99 {p99 * 1e3:7.2f} ms  '
+                      f'{failures} gave up  {committed} committed')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+import asyncio
+import statistics
+import time
+
+from Benchmarks.Board import random_row
+from Config import CanvasConfig
+from Wordle.Canvas import Drawing
+from Wordle.RenderService import RenderService
+
+
+async def monitor(stopped: asyncio.Event, interval: float = 0.005) -> list:
+    """ How late the loop wakes a task that sleeps for interval """
+    lags = []
+    while not stopped.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+    return lags
+
+
+async def load(service: RenderService, renders: int, concurrency: int) -> tuple:
+    drawings = [Drawing(rows=tuple(tuple(random_row(5)) for _ in range(6)))
+                for _ in range(renders)]
+
+    # Warm the workers
+    await asyncio.gather(*(service.render(drawing) for drawing in drawings[:concurrency]))
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def render(drawing: Drawing):
+        async with semaphore:
+            await service.render(drawing)
+
+    stopped = asyncio.Event()
+    lags = asyncio.create_task(monitor(stopped))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(render(drawing) for drawing in drawings))
+    elapsed = time.perf_counter() - start
+
+    stopped.set()
+    return elapsed, await lags
+
+
+def main():
+    renders, concurrency = 200, 8
+    print(f'{renders} 5 letter, 6 guess boards, {concurrency} at a time')
+
+    for executor in ['inline', 'thread', 'process']:
+        service = RenderService(CanvasConfig(row_cache_bytes=0), executor=executor, pool_size=4)
+        elapsed, lags = asyncio.run(load(service, renders, concurrency))
+        service.shutdown()
+
+        lags = sorted(lags)
+        print(f'  {executor:<8} {renders / elapsed:6.0f} renders/s  loop lag '
+              f'median {statistics.median(lags) * 1e3:6.2f} ms  '
+              f'p99 {lags[int(len(lags) * 0.99)] * 1e3:6.2f} ms  '
+              f'max {lags[-1] * 1e3:6.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
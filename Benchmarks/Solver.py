@@ -0,0 +1,61 @@
+import random
+import time
+
+from Wordle.Feedback import Feedback
+from Wordle.Solver import Solver
+
+# Rough English letter frequencies so the synthetic buckets split like real ones
+LETTERS = 'etaoinshrdlcumwfgypbvkjxqz'
+WEIGHTS = [12.7, 9.1, 8.2, 7.5, 7.0, 6.7, 6.3, 6.1, 6.0, 4.3, 4.0, 2.8, 2.8,
+           2.4, 2.4, 2.2, 2.0, 2.0, 1.9, 1.5, 1.0, 0.8, 0.2, 0.2, 0.1, 0.1]
+
+
+def bucket(length: int, size: int) -> list[str]:
+    words = set()
+    while len(words) < size:
+        words.add(''.join(random.choices(LETTERS, weights=WEIGHTS, k=length)))
+    return sorted(words)
+
+
+def timed(fn) -> tuple:
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def run(length: int, size: int, budget: float):
+    solver = Solver(bucket(length, size), latency_budget=budget)
+    target = random.choice(solver.words)
+
+    opener, cold = timed(lambda: solver.suggest())
+    memoized = solver._opener is not None
+    _, warm = timed(lambda: solver.suggest())
+
+    history = ((opener, Feedback.pattern(opener, target)),)
+    second, after_one = timed(lambda: solver.suggest(solver.candidates(history)))
+
+    history += ((second, Feedback.pattern(second, target)),)
+    _, after_two = timed(lambda: solver.suggest(solver.candidates(history)))
+
+    print(f'  length={length} opener: {cold:7.1f} ms (again {warm:7.3f} ms, '
+          f'{"memoized" if memoized else "searched again"})  '
+          f'after 1 guess: {after_one:7.1f} ms '
+          f'({len(solver.candidates(history[:1]))} left)  '
+          f'after 2 guesses: {after_two:6.1f} ms '
+          f'({len(solver.candidates(history))} left)')
+
+
+def main():
+    budget = 0.25
+    size = 10_000
+    print(f'{size} words per length, {budget * 1000:.0f} ms budget')
+    for length in range(4, 9):
+        run(length, size, budget)
+
+    # Small enough to score every answer, so the opener is memoized
+    print(f'1000 words, {budget * 1000:.0f} ms budget')
+    run(5, 1000, budget)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+import os
+import tempfile
+import time
+
+from Benchmarks.Fixtures import create_database
+from Config import Config
+from Wordle.Canvas import Canvas
+from Wordle.Canvas.Glyph import GlyphCollection, GlyphFactory
+from Wordle.Words import Words
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        create_database(directory, 100_000)
+        Words.COMPILED = os.path.join(directory, 'wordle.dict')
+        config = Config(token='', wordlist='')
+
+        print('seconds per startup phase')
+        print(f'  config load            {timed(lambda: Config(token="", wordlist="")):8.4f}')
+
+        for label, cache_dir in [('uncached', None), ('cold', directory), ('warm', directory)]:
+            config.canvas.glyph.cache_dir = cache_dir
+
+            GlyphCollection._state.clear()
+            factory = timed(lambda: GlyphFactory(config.canvas.glyph))
+            canvas = timed(lambda: Canvas(config.canvas))
+            print(f'  glyph metrics {label:<8} {factory:8.4f}')
+            print(f'  canvas {label:<15} {canvas:8.4f}')
+
+        print(f'  word index load        {timed(Words.load):8.4f}')
+        print(f'  word index compile     {timed(Words.compile):8.4f}')
+        print(f'  word file map          {timed(lambda: Words.load("mmap")):8.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import os
+import random
+import sqlite3
+import string
+import tempfile
+import timeit
+from contextlib import closing
+
+from Wordle.WordIndex import WordIndex
+
+
+def create_database(path: str, size: int):
+    con = sqlite3.connect(path)
+    with closing(con), closing(con.cursor()) as cur:
+        cur.execute(
+            'CREATE TABLE words (word CHAR(25) NOT NULL, definition VARCHAR(255) NOT NULL)')
+        cur.executemany('INSERT INTO words VALUES(?,?)', (
+            (''.join(random.choices(string.ascii_lowercase, k=random.randint(3, 12))),
+             'A synthetic definition.\n')
+            for _ in range(size)))
+        con.commit()
+
+
+def sqlite_get_by_word(path: str, word: str):
+    con = sqlite3.connect(path)
+    with closing(con.cursor()) as cur:
+        cur.execute(
+            'SELECT word, definition FROM words WHERE word=?', (word,))
+        return cur.fetchall()
+
+
+def sqlite_get_random(path: str, word_length: int):
+    con = sqlite3.connect(path)
+    with closing(con.cursor()) as cur:
+        cur.execute(
+            'SELECT word, definition FROM words '
+            'WHERE LENGTH(word)=? ORDER BY RANDOM() LIMIT ?',
+            (word_length, 1))
+        return cur.fetchall()
+
+
+def per_call_us(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e6
+
+
+def run(size: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'wordle.db')
+        create_database(path, size)
+
+        number = 2000 if size <= 10000 else 50
+        load_s = min(timeit.repeat(
+            lambda: WordIndex.from_database(path), number=1, repeat=3))
+        index = WordIndex.from_database(path)
+
+        results = {
+            'get_random': (
+                per_call_us(lambda: sqlite_get_random(path, 5), number),
+                per_call_us(lambda: index.get_random(5), number * 10)),
+            'get_by_word': (
+                per_call_us(lambda: sqlite_get_by_word(path, 'crane'), number),
+                per_call_us(lambda: index.get_by_word('crane'), number * 10)),
+        }
+
+    print(f'{size} words (index load: {load_s * 1000:.1f} ms)')
+    for name, (before, after) in results.items():
+        print(f'  {name:<12} sqlite: {before:10.1f} us  index: {after:6.2f} us')
+
+
+def main():
+    for size in [10_000, 500_000]:
+        run(size)
+
+
+if __name__ == '__main__':
+    main()
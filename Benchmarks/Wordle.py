@@ -0,0 +1,63 @@
+import asyncio
+import logging
+import random
+import statistics
+import tempfile
+import time
+
+from Benchmarks.Fixtures import Context, create_database
+from Config import Config
+from Wordle.RenderService import RenderService
+from Wordle.Store import InMemoryStore
+from Wordle.Wordle import Wordle
+from Wordle.Words import Words
+from Wordle.WordsService import WordsService
+
+
+async def run(output: str, games: int) -> dict:
+    config = Config(token='', wordlist='', output=output)
+    renders = RenderService(config.canvas, executor=config.canvas.executor)
+    cog = Wordle(None, config=config, state_backend=InMemoryStore(),
+                 words=WordsService(pool_size=0), renders=renders,
+                 logger=logging.getLogger('Benchmark'))
+
+    commands = {
+        'guess': lambda ctx: cog.guess.callback(cog, ctx, random.choice(guesses).word),
+        'progress': lambda ctx: cog.progress.callback(cog, ctx),
+        'again': lambda ctx: cog.progress.callback(cog, ctx),
+        'hint': lambda ctx: cog.hint.callback(cog, ctx),
+        'known_letters': lambda ctx: cog.known_letters.callback(cog, ctx)}
+    latencies = {name: [] for name in commands}
+
+    guesses = Words.get_random(5, 50)
+    for channel in range(games):
+        ctx = Context(channel)
+        await cog.start.callback(cog, ctx, 5, 'easy')
+
+        for _ in range(4):
+            for name, command in commands.items():
+                start = time.perf_counter()
+                await command(ctx)
+                latencies[name].append(time.perf_counter() - start)
+
+    renders.shutdown()
+    return latencies
+
+
+def main():
+    games = 50
+
+    with tempfile.TemporaryDirectory() as directory:
+        create_database(directory, 10_000)
+        Words.load()
+
+        print(f'median ms per command over {games} games, excluding Discord upload time')
+        for output in ['image', 'text']:
+            latencies = asyncio.run(run(output, games))
+            print(f'  {output:<6}' + ''.join(
+                f'{name} {statistics.median(values) * 1e3:6.2f}  '
+                for name, values in latencies.items()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+import asyncio
+import random
+import statistics
+import string
+import tempfile
+import time
+
+from Benchmarks.Fixtures import create_database
+from Wordle.Words import Words
+from Wordle.WordsService import WordsService
+
+
+async def measure_lag(stop: asyncio.Event, interval: float = 0.001) -> list[float]:
+    lags = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+    return lags
+
+
+async def guess(service: WordsService):
+    # A %guess validates the word; every tenth player also asks for a suggestion
+    await service.contains(''.join(random.choices(string.ascii_lowercase, k=5)))
+    if random.random() < 0.1:
+        await service.get_random(5)
+
+
+async def run(pool_size: int, concurrency: int, rounds: int = 5):
+    service = WordsService(pool_size=pool_size)
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(measure_lag(stop))
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*[guess(service) for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    lags = sorted(await monitor)
+    service.shutdown()
+
+    print(f'  pool_size={pool_size} concurrency={concurrency:<4} '
+          f'{concurrency * rounds / elapsed:8.0f} guesses/s  '
+          f'loop lag p50={statistics.median(lags) * 1000:6.2f} ms '
+          f'max={lags[-1] * 1000:7.2f} ms')
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        create_database(directory, 200_000, lengths=(3, 8))
+        Words.load('sqlite')
+
+        print('sqlite source, 200k words')
+        for concurrency in [10, 100, 500]:
+            for pool_size in [0, 4]:
+                asyncio.run(run(pool_size, concurrency))
+
+        Words.load('index')
+        print('index source, 200k words, looked up inline whatever the pool size')
+        for concurrency in [10, 100, 500]:
+            asyncio.run(run(4, concurrency))
+
+
+if __name__ == '__main__':
+    main()
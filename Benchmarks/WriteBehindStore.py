@@ -0,0 +1,98 @@
+import asyncio
+import statistics
+import tempfile
+import time
+
+import fakeredis
+import fakeredis.aioredis
+from aioredis import ConnectionPool
+
+from Benchmarks.Fixtures import channel, create_database
+from Benchmarks.RedisStore import SlowClient
+from Wordle.GameManager import GameManager
+from Wordle.Store import InMemoryStore, RedisStore, WriteBehindStore
+from Wordle.Words import Words
+from Wordle.WordsService import WordsService
+
+
+def redis_store(server: fakeredis.FakeServer) -> RedisStore:
+    pool = ConnectionPool(server=server, connection_class=fakeredis.aioredis.FakeConnection)
+    return RedisStore(SlowClient(connection_pool=pool))
+
+
+async def play(games: GameManager, channels: int, guesses: int, rtt: float) -> list:
+    words = [word.word for word in Words.get_random(5, guesses)]
+    for channel_id in range(channels):
+        await games.add_game(channel(channel_id), await games.create_game(5, 'easy'))
+
+    latencies = []
+    SlowClient.rtt = rtt
+    for word in words:
+        for channel_id in range(channels):
+            start = time.perf_counter()
+            await games.guess(channel(channel_id), word, author_id=0)
+            latencies.append(time.perf_counter() - start)
+
+            # Guesses arrive as separate messages, giving the flusher a turn
+            await asyncio.sleep(0.001)
+    SlowClient.rtt = 0
+
+    return latencies
+
+
+async def run(write_behind: bool, rtt: float) -> tuple:
+    server = fakeredis.FakeServer()
+    store = redis_store(server)
+    if write_behind:
+        store = WriteBehindStore(InMemoryStore(), store, flush_interval=0.05, flush_size=10)
+        flusher = asyncio.get_running_loop().create_task(store.run())
+
+    games = GameManager(store, WordsService(pool_size=0))
+    latencies = await play(games, 20, 5, rtt)
+
+    if not write_behind:
+        return latencies, None
+
+    flusher.cancel()
+    await store.flush()
+
+    # A restarted process must come back with exactly the games it flushed,
+    # dropping whatever a standby had in memory before taking over
+    restarted = WriteBehindStore(InMemoryStore(), redis_store(server))
+    await restarted.add_game(0, 99, await games.create_game(5, 'easy'))
+    start = time.perf_counter()
+    restored = await restarted.rehydrate()
+    elapsed = time.perf_counter() - start
+    assert len(restarted.memory) == restored and restarted.pending == 0, (len(restarted.memory), restored)
+
+    for channel_id in range(20):
+        before = await store.get_game(0, channel_id)
+        after = await restarted.get_game(0, channel_id)
+        assert (before.version, before.guesses, before.target.word) == \
+               (after.version, after.guesses, after.target.word)
+
+    return latencies, (store, restored, elapsed)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        create_database(directory, 10_000)
+        Words.load()
+
+        rtt = 0.0005
+        print(f'ms per guess over 20 channels x 5 guesses, rtt {rtt * 1e3:3.1f} ms')
+        for name, write_behind in [('redis', False), ('write-behind', True)]:
+            latencies, flushed = asyncio.run(run(write_behind, rtt))
+            latencies.sort()
+            print(f'  {name:<12} p50 {statistics.median(latencies) * 1e3:6.3f}  '
+                  f'p99 {latencies[int(len(latencies) * 0.99)] * 1e3:6.3f}')
+
+            if flushed is not None:
+                store, restored, elapsed = flushed
+                print(f'  {store.flushes} flushes wrote {store.flushed} games for '
+                      f'{len(latencies) + 20} writes; restart restored {restored} '
+                      f'identical games in {elapsed * 1e3:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 from pathlib import Path
+from PIL import features
 from pydantic import BaseModel, validator
-from typing import Union
+from typing import Optional, Union
 
 from Config.Base import Settings
 
@@ -20,6 +21,13 @@ class GlyphConfig(BaseModel):
     wide_horizontal_pad: int = 35
     wide_vertical_pad: int = 0
 
+    # Pre-renders every glyph into one sprite sheet at startup
+    atlas: bool = True
+
+    # When set, font metrics and the glyph atlas are saved here, keyed by
+    # these settings and the font file, and reused on later starts
+    cache_dir: Optional[str] = None
+
     @validator('font_path')
     def font_path_exists(cls, v):
         if Path(v).exists():
@@ -27,8 +35,123 @@ class GlyphConfig(BaseModel):
         raise ValueError('file not found')
 
 
+class EncodingConfig(BaseModel):
+    # 'png' or 'webp', which needs Pillow built against libwebp
+    format: str = 'png'
+
+    # Writes PNGs as 8-bit palette images using the fixed GlyphColor palette
+    palette: bool = True
+    compress_level: int = 6
+
+    # WebP options
+    lossless: bool = True
+    quality: int = 90
+    method: int = 0
+
+    @validator('format')
+    def format_supported(cls, v):
+        valid = ['png', 'webp'] if features.check('webp') else ['png']
+        if v in valid:
+            return v
+        raise ValueError(f'permitted with this Pillow build: {", ".join(valid)}')
+
+    @validator('compress_level')
+    def compress_level_range(cls, v):
+        if 0 <= v <= 9:
+            return v
+        raise ValueError('must be between 0 and 9')
+
+
 class CanvasConfig(BaseModel):
     glyph: GlyphConfig = GlyphConfig()
+    encoding: EncodingConfig = EncodingConfig()
+
+    # 'pil' pastes glyph images, 'numpy' builds rows and boards from arrays
+    # of atlas tiles and only converts to an image when encoding
+    backend: str = 'pil'
+
+    # Where images are drawn and encoded: 'thread' and 'process' pools keep
+    # the work off the event loop, 'inline' runs it on the loop
+    executor: str = 'thread'
+    pool_size: int = 2
+
+    # Bytes of rendered word rows kept for reuse, counting pixels and, when
+    # row_cache_encode is set, their encoded files too. 0 disables the cache.
+    row_cache_bytes: int = 16 * 1024 * 1024
+    row_cache_encode: bool = False
+
+    # Bytes of encoded images, such as %hint keyboards and %progress boards,
+    # shared by every game
+    render_cache_bytes: int = 4 * 1024 * 1024
+
+    @validator('backend')
+    def backend_supported(cls, v):
+        valid = ['pil', 'numpy']
+        if v in valid:
+            return v
+        raise ValueError(f'permitted: {", ".join(valid)}')
+
+    @validator('executor')
+    def executor_supported(cls, v):
+        valid = ['inline', 'thread', 'process']
+        if v in valid:
+            return v
+        raise ValueError(f'permitted: {", ".join(valid)}')
+
+    @validator('pool_size')
+    def pool_size_positive(cls, v):
+        if v > 0:
+            return v
+        raise ValueError('must be positive')
+
+
+class FeedbackConfig(BaseModel):
+    # Word lengths whose full guess x answer pattern matrix is computed at
+    # startup. Memory grows with the square of the bucket size.
+    precompute_lengths: list[int] = []
+
+
+class SolverConfig(BaseModel):
+    # Seconds spent scoring guesses for %suggest before settling on the best
+    # so far, and the number of remaining answers scored against
+    latency_budget: float = 0.25
+    sample_size: int = 2000
+
+
+class WordsConfig(BaseModel):
+    # 'index' loads the dictionary into memory, 'mmap' maps a compiled word
+    # file that is shared between processes on the same host and 'sqlite'
+    # queries wordle.db directly
+    source: str = 'index'
+
+    # Threads used for sqlite lookups and the solver; 0 runs them on the
+    # event loop. The index and mmap sources are always read inline.
+    pool_size: int = 4
+
+    # Rejects non-words with a Bloom filter before consulting the source.
+    # The filter is loaded from filter_path when set, or built at startup.
+    filter: bool = False
+    filter_error_rate: float = 0.01
+    filter_path: Optional[str] = None
+
+    @validator('source')
+    def source_supported(cls, v):
+        valid = ['index', 'mmap', 'sqlite']
+        if v in valid:
+            return v
+        raise ValueError(f'permitted: {", ".join(valid)}')
+
+    @validator('pool_size')
+    def pool_size_not_negative(cls, v):
+        if v >= 0:
+            return v
+        raise ValueError('cannot be negative')
+
+    @validator('filter_error_rate')
+    def error_rate_in_range(cls, v):
+        if 0 < v < 1:
+            return v
+        raise ValueError('must be between 0 and 1')
 
 
 class RedisConfig(BaseModel):
@@ -36,6 +159,24 @@ class RedisConfig(BaseModel):
     host: str = '127.0.0.1'
     port: Union[str, int] = 6379
 
+    # Wire format for stored games. 'compact' still reads keys written by
+    # 'pickle'; lz4 compression needs the optional lz4 package.
+    codec: str = 'compact'
+    compression: str = 'none'
+
+    # Decoded games kept in process and dropped when another replica
+    # writes them, announced over pub/sub. 0 disables the cache.
+    near_cache_size: int = 0
+
+    # Serves games from memory and copies changes to Redis in batches,
+    # every flush_interval seconds or once flush_size games have changed.
+    # Games are reloaded from Redis whenever the bot lock is acquired and
+    # flushed on shutdown. Never reads Redis otherwise, so it cannot be
+    # combined with the near cache.
+    write_behind: bool = False
+    flush_interval: float = 1.0
+    flush_size: int = 100
+
     @validator('host', 'port', each_item=True)
     def host_port_not_empty_if_enabled(cls, v, values):
         if 'enable' in values and not v:
@@ -49,6 +190,71 @@ class RedisConfig(BaseModel):
         except ValueError:
             raise ValueError('must be an integer')
 
+    @validator('near_cache_size')
+    def near_cache_size_not_negative(cls, v):
+        if v >= 0:
+            return v
+        raise ValueError('cannot be negative')
+
+    @validator('write_behind')
+    def write_behind_without_near_cache(cls, v, values):
+        if v and values.get('near_cache_size'):
+            raise ValueError('cannot be combined with near_cache_size')
+        return v
+
+    @validator('flush_interval', 'flush_size')
+    def flush_threshold_positive(cls, v):
+        if v > 0:
+            return v
+        raise ValueError('must be positive')
+
+    @validator('codec')
+    def codec_supported(cls, v):
+        valid = ['compact', 'pickle']
+        if v in valid:
+            return v
+        raise ValueError(f'permitted: {", ".join(valid)}')
+
+    @validator('compression')
+    def compression_supported(cls, v):
+        valid = ['none', 'zlib', 'lz4']
+        if v in valid:
+            return v
+        raise ValueError(f'permitted: {", ".join(valid)}')
+
+
+class StoreConfig(BaseModel):
+    # Seconds a game may go unplayed before it is dropped from memory and
+    # expires in Redis, e.g. 604800 for a week. 0 keeps games until they end.
+    ttl: int = 0
+
+    # Games kept in memory, dropping the least recently played first.
+    # 0 is unbounded.
+    max_games: int = 0
+
+    # Seconds between sweeps for expired games in memory
+    sweep_interval: float = 60.0
+
+    # Without Redis, logs every game change to this directory and restores
+    # the games from it on start. Changes are fsynced in batches every
+    # journal_interval seconds, and the log is compacted into a snapshot
+    # once it outgrows journal_compact_bytes.
+    journal_dir: Optional[str] = None
+    journal_interval: float = 0.05
+    journal_compact_bytes: int = 64 * 1024 * 1024
+
+    @validator('ttl', 'max_games')
+    def not_negative(cls, v):
+        if v >= 0:
+            return v
+        raise ValueError('cannot be negative')
+
+    @validator('sweep_interval', 'journal_interval', 'journal_compact_bytes')
+    def positive(cls, v):
+        if v > 0:
+            return v
+        raise ValueError('must be positive')
+
 
 class Config(Settings):
     token: str
@@ -58,11 +264,38 @@ class Config(Settings):
     verbose: bool = False
 
     redis: RedisConfig = RedisConfig()
+    store: StoreConfig = StoreConfig()
+    words: WordsConfig = WordsConfig()
+    feedback: FeedbackConfig = FeedbackConfig()
+    solver: SolverConfig = SolverConfig()
     canvas: CanvasConfig = CanvasConfig()
 
     allow_channels: list[int] = []
     deny_channels: list[int] = []
 
+    # 'image' uploads rendered boards, 'text' replies with emoji squares.
+    # Channels listed under the other mode override the default.
+    output: str = 'image'
+    image_channels: list[int] = []
+    text_channels: list[int] = []
+
+    # Times a guess is replayed on a fresh read of the game after losing a
+    # race with another guess before it waits for the channel lock instead
+    guess_retries: int = 5
+
+    @validator('output')
+    def output_supported(cls, v):
+        valid = ['image', 'text']
+        if v in valid:
+            return v
+        raise ValueError(f'permitted: {", ".join(valid)}')
+
+    @validator('guess_retries')
+    def guess_retries_not_negative(cls, v):
+        if v >= 0:
+            return v
+        raise ValueError('cannot be negative')
+
     @validator('log_level')
     def log_level_supported(cls, v):
         valid = ['DEBUG', 'INFO', 'WARN', 'ERROR', 'CRITICAL', 'FATAL']
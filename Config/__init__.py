@@ -1 +1 @@
-from .Config import Config, RedisConfig, CanvasConfig, GlyphConfig
+from .Config import Config, RedisConfig, CanvasConfig, GlyphConfig, EncodingConfig, WordsConfig, FeedbackConfig, SolverConfig, StoreConfig
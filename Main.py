@@ -7,6 +7,7 @@ import random
 import signal
 import sys
 import logging
+from typing import Optional
 
 from discord import Message
 from discord.ext import commands
@@ -15,11 +16,16 @@ from Config import Config
 from ErrorHandler.ErrorHandler import ErrorHandler
 from Helpers.RandomText import RandomText
 from Ping.Ping import Ping
+from Wordle.Feedback import Feedback
 from Wordle.Lock import Lock, LockNotOwnedError
+from Wordle.RenderService import RenderService
 from Wordle.Wordle import Wordle
 from Wordle.Words import Words
+from Wordle.WordsService import WordsService
 from Wordle.RedisClient import RedisClient, RedisConnectionError
-from Wordle.Store import InMemoryLock, InMemoryStore, RedisStore, Store
+from Wordle.Store import InMemoryLock, InMemoryStore, RedisStore, Store, WriteBehindStore
+from Wordle.Store.InMemory import Journal
+from Wordle.Store.Redis import NearCache, create_codec
 
 
 def shutdown(sig: signal, event: asyncio.Event, logger: logging.Logger):
@@ -38,7 +44,17 @@ async def run(config: Config):
         loop.add_signal_handler(
             sig, functools.partial(shutdown, sig, stopped, logger))
 
-    state_backend: Store = InMemoryStore()
+    ttl = config.store.ttl or None
+    memory: Optional[InMemoryStore] = InMemoryStore(ttl=ttl, max_games=config.store.max_games or None)
+    state_backend: Store = memory
+    words = WordsService(
+        pool_size=config.words.pool_size,
+        solver_budget=config.solver.latency_budget,
+        solver_sample_size=config.solver.sample_size)
+    renders = RenderService(
+        config.canvas,
+        executor=config.canvas.executor,
+        pool_size=config.canvas.pool_size)
 
     lock: Lock = InMemoryLock()
     lock_timeout: float = 10.0
@@ -54,14 +70,41 @@ async def run(config: Config):
         logger.info(
             f'Connected to Redis server at {config.redis.host}:{config.redis.port}')
 
-        state_backend = RedisStore(redis)
+        state_backend = RedisStore(
+            redis,
+            codec=create_codec(config.redis.codec, config.redis.compression),
+            cache=NearCache(config.redis.near_cache_size) if config.redis.near_cache_size else None,
+            ttl=ttl)
+
+        if config.redis.write_behind:
+            state_backend = WriteBehindStore(
+                memory,
+                state_backend,
+                flush_interval=config.redis.flush_interval,
+                flush_size=config.redis.flush_size)
+        else:
+            memory = None
+            if state_backend.cache is not None:
+                loop.create_task(state_backend.listen(), name='near_cache')
+
         lock_key = hashlib.sha256(config.token.encode()).hexdigest()
         lock = redis.lock(
             f'wordlebot:lock:{lock_key}', timeout=lock_timeout, blocking_timeout=1)
 
+    if state_backend is memory and config.store.journal_dir:
+        memory.journal = Journal(config.store.journal_dir)
+        logger.info(f'Recovered {await memory.recover()} games from {config.store.journal_dir}')
+        loop.create_task(memory.journal.run(
+            memory.items,
+            interval=config.store.journal_interval,
+            compact_bytes=config.store.journal_compact_bytes), name='journal')
+
+    if memory is not None and ttl:
+        loop.create_task(memory.run(config.store.sweep_interval), name='sweeper')
+
     bot.add_cog(ErrorHandler(bot, logger=logger))
     bot.add_cog(Wordle(bot, config=config,
-                state_backend=state_backend, logger=logger))
+                state_backend=state_backend, words=words, renders=renders, logger=logger))
     bot.add_cog(Ping(bot, logger=logger))
 
     @bot.event
@@ -132,6 +175,7 @@ async def run(config: Config):
 
     locked = asyncio.Event()
     unlocked = asyncio.Event()
+    held = False
 
     logger.info('Attempting to acquire lock...')
 
@@ -148,18 +192,57 @@ async def run(config: Config):
                         unlocked_event=unlocked,
                         stop_event=stopped,
                         new_ttl=lock_timeout),
-                    name='extend_lock'),
-                loop.create_task(
-                    bot.start(config.token),
-                    name='bot')]
+                    name='extend_lock')]
+
+            # Another instance may have written to Redis while this one was
+            # waiting, so memory is only trusted once reloaded under the lock
+            if isinstance(state_backend, WriteBehindStore):
+                try:
+                    logger.info(f'Restored {await state_backend.rehydrate()} games from Redis')
+                    tasks.append(loop.create_task(state_backend.run(), name='write_behind'))
+                except RedisConnectionError as e:
+                    logger.error(f'Unable to restore games from Redis: {e}')
+                    unlocked.set()
+
+            if not unlocked.is_set():
+                tasks.append(loop.create_task(bot.start(config.token), name='bot'))
 
             await unlocked.wait()
+            held = stopped.is_set()
 
             for task in tasks:
                 logging.info(f'Cancelling task: {task.get_name()}')
                 task.cancel()
 
     await stopped.wait()
+    if isinstance(state_backend, WriteBehindStore) and held:
+        try:
+            logger.info(f'Flushed {await state_backend.flush()} games to Redis')
+        except RedisConnectionError as e:
+            logger.error(f'Lost {state_backend.pending} games, unable to flush to Redis: {e}')
+    elif isinstance(state_backend, WriteBehindStore):
+        logger.warning(f'Not flushing {state_backend.pending} games to Redis without the lock')
+    words.shutdown()
+    renders.shutdown()
+    if renders.cache_bytes:
+        logger.info(f'Render cache: {renders}')
+    # Process workers each keep their own rows, out of reach here
+    if renders.canvas is not None and renders.canvas.row_cache is not None:
+        logger.info(f'Row cache: {renders.canvas.row_cache}')
+    if Words.filter() is not None:
+        logger.info(f'Word filter: {Words.filter()}')
+    if getattr(state_backend, 'cache', None) is not None:
+        logger.info(f'Near cache: {state_backend.cache}')
+    if memory is not None:
+        logger.info(f'Games in memory: {memory}')
+    if memory is not None and memory.journal is not None:
+        try:
+            await memory.journal.flush()
+            memory.journal.close()
+            logger.info(f'Journal: {memory.journal}')
+        except OSError as e:
+            logger.error(f'Lost {memory.journal.pending} journal records, unable to write them: {e}')
+
     try:
         await lock.release()
     except LockNotOwnedError:
@@ -200,6 +283,20 @@ def main():
         Words.seed()
         logger.info('Setup complete.')
 
+    logger.info(f'Loading words from {config.words.source} source...')
+    logger.info(f'Loaded {len(Words.load(config.words.source))} words')
+
+    if config.words.filter:
+        bloom = Words.load_filter(
+            error_rate=config.words.filter_error_rate,
+            path=config.words.filter_path)
+        logger.info(f'Loaded word filter ({len(bloom.bits)} bytes)')
+
+    for length in config.feedback.precompute_lengths:
+        matrix = Feedback.precompute(length, Words.source().words(length))
+        logger.info(
+            f'Precomputed {length} letter feedback patterns ({matrix.nbytes} bytes)')
+
     try:
         asyncio.run(run(config))
     except Exception as e:
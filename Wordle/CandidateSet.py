@@ -0,0 +1,46 @@
+from typing import Optional
+
+import numpy as np
+
+
+class CandidateSet:
+    """
+    Bitset over the words of one length bucket that are still consistent
+    with a game's guesses. Pickles as whichever of the packed bits or the
+    surviving indices is smaller.
+    """
+
+    def __init__(self, size: int, bits: Optional[bytes] = None, count: Optional[int] = None):
+        self.size: int = size
+        self.bits: bytes = bits if bits is not None else \
+            np.packbits(np.ones(size, dtype=bool)).tobytes()
+        self.count: int = count if count is not None else int(self.mask().sum())
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getstate__(self) -> tuple:
+        indices = self.indices()
+        if indices.nbytes < len(self.bits):
+            return self.size, None, indices.tobytes()
+        return self.size, self.bits, None
+
+    def __setstate__(self, state: tuple):
+        size, bits, indices = state
+        if bits is None:
+            mask = np.zeros(size, dtype=bool)
+            mask[np.frombuffer(indices, dtype=np.uint32)] = True
+            bits = np.packbits(mask).tobytes()
+
+        self.__init__(size=size, bits=bits)
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> 'CandidateSet':
+        return cls(size=len(mask), bits=np.packbits(mask).tobytes(), count=int(mask.sum()))
+
+    def mask(self) -> np.ndarray:
+        return np.unpackbits(
+            np.frombuffer(self.bits, dtype=np.uint8), count=self.size).astype(bool)
+
+    def indices(self) -> np.ndarray:
+        return np.flatnonzero(self.mask()).astype(np.uint32)
@@ -0,0 +1,73 @@
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from Wordle.Canvas.Glyph import GlyphAtlas, GlyphColor, GlyphShape
+
+
+class ArrayCompositor:
+    """
+    Compositing on NumPy RGBA arrays. Every glyph tile is cut out of the
+    atlas once into one (tiles, height, width, 4) array per shape, so a row
+    is a single gather and slice assignment into a zeroed buffer, and boards
+    stack rows the same way Canvas.vertical_join pastes them.
+    """
+
+    def __init__(self, atlas: GlyphAtlas, spacer_width: int):
+        self.spacer_width: int = spacer_width
+        self._atlas: GlyphAtlas = atlas
+
+        pixels = np.asarray(atlas.image)
+        self._tiles: Dict[GlyphShape, np.ndarray] = {}
+        self._index: Dict[Tuple[str, GlyphColor], int] = {}
+
+        colors = list(GlyphColor)
+        chars = atlas.chars
+        for shape in GlyphShape:
+            x_offset, width, height = atlas.section(shape)
+            rows = math.ceil(len(colors) * len(chars) / GlyphAtlas.COLUMNS)
+
+            section = pixels[:rows * height, x_offset:x_offset + GlyphAtlas.COLUMNS * width]
+            self._tiles[shape] = np.ascontiguousarray(
+                section.reshape(rows, height, GlyphAtlas.COLUMNS, width, 4)
+                .transpose(0, 2, 1, 3, 4)
+                .reshape(-1, height, width, 4)[:len(colors) * len(chars)])
+
+        for i, color in enumerate(colors):
+            for j, char in enumerate(chars):
+                self._index[char, color] = i * len(chars) + j
+
+    def index(self, char: str, color: GlyphColor) -> int:
+        try:
+            return self._index[char, color]
+        except KeyError:
+            return self._index[self._atlas.resolve(char, color)]
+
+    def draw_word(self, word: List[Tuple[str, GlyphColor]], shape: GlyphShape) -> np.ndarray:
+        spacer = self.spacer_width
+        tiles = self._tiles[shape][[self.index(char, color) for char, color in word]]
+        count, height, width, _ = tiles.shape
+
+        row = np.zeros((height + 2 * spacer, count * (width + spacer) + spacer, 4), dtype=np.uint8)
+
+        # Splitting the row into (glyph, column) is a view, so this writes every tile at once
+        cells = row[spacer:spacer + height, spacer:].reshape(height, count, width + spacer, 4)
+        cells[:, :, :width] = tiles.transpose(1, 0, 2, 3)
+
+        return row
+
+    def join(self, rows: List[np.ndarray]) -> np.ndarray:
+        spacer = self.spacer_width
+        width = max(row.shape[1] for row in rows)
+        height = sum(row.shape[0] - spacer for row in rows) + spacer
+
+        board = np.zeros((height, width, 4), dtype=np.uint8)
+
+        y_offset = 0
+        for row in rows:
+            x_offset = max(0, math.ceil((width - row.shape[1]) / 2))
+            board[y_offset:y_offset + row.shape[0], x_offset:x_offset + row.shape[1]] = row
+            y_offset += row.shape[0] - spacer
+
+        return board
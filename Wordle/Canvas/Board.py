@@ -0,0 +1,55 @@
+import math
+from typing import TYPE_CHECKING, Optional
+
+from PIL import Image as PILImage
+
+from Wordle.Canvas.Image import Image
+
+if TYPE_CHECKING:
+    from Wordle.Canvas.ImageEncoder import ImageEncoder
+
+
+class Board:
+    """
+    Rows of a game's progress stacked like Canvas.vertical_join, but drawn
+    into one surface allocated up front. Adding a row pastes only that row;
+    the surface doubles when a game outgrows it, and the rows drawn so far
+    are cropped out when the image is sent.
+    """
+
+    def __init__(self,
+                 width: int,
+                 row_height: int,
+                 spacer_width: int,
+                 rows: int,
+                 encoder: Optional['ImageEncoder'] = None):
+        self.width: int = width
+        self.row_height: int = row_height
+        self.spacer_width: int = spacer_width
+        self.rows: int = 0
+        self.encoder: Optional['ImageEncoder'] = encoder
+        self.image: PILImage.Image = PILImage.new(
+            'RGBA', (width, self._height(max(rows, 1))))
+
+    @property
+    def capacity(self) -> int:
+        return (self.image.height - self.spacer_width) // (self.row_height - self.spacer_width)
+
+    def _height(self, rows: int) -> int:
+        return rows * (self.row_height - self.spacer_width) + self.spacer_width
+
+    def append(self, row: Image):
+        if self.rows == self.capacity:
+            image = PILImage.new('RGBA', (self.width, self._height(2 * self.capacity)))
+            image.paste(self.image, (0, 0))
+            self.image = image
+
+        x_offset = max(0, math.ceil((self.width - row.width) / 2))
+        self.image.paste(row.image, (x_offset, self._height(self.rows) - self.spacer_width))
+        self.rows += 1
+
+    def export(self) -> Optional[Image]:
+        if not self.rows:
+            return None
+
+        return Image(self.image.crop((0, 0, self.width, self._height(self.rows))), encoder=self.encoder)
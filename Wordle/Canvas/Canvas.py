@@ -2,22 +2,44 @@
 import logging
 import math
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from PIL import Image as PILImage
 
 from Config import CanvasConfig
 
 from Wordle.Canvas.Glyph import (
-    Glyph, GlyphCollection, GlyphColor, GlyphShape,
+    Glyph, GlyphAtlas, GlyphCollection, GlyphColor, GlyphShape,
     GlyphFactory, GlyphNotFound)
+from Wordle.Canvas.ArrayCompositor import ArrayCompositor
+from Wordle.Canvas.Board import Board
+from Wordle.Canvas.Drawing import Drawing
 from Wordle.Canvas.Image import Image
+from Wordle.Canvas.ImageEncoder import ImageEncoder
+from Wordle.Canvas.RowCache import RowCache
 
 
 class Canvas:
     def __init__(self, config: CanvasConfig):
+        self.encoder: ImageEncoder = ImageEncoder(config.encoding)
+
         self._glyphs: GlyphCollection = GlyphCollection()
         self._glyph_factory: GlyphFactory = GlyphFactory(config.glyph)
+        self._atlas: Optional[GlyphAtlas] = None
+        self._compositor: Optional[ArrayCompositor] = None
+
+        # The numpy backend always needs the atlas, but keeps its tiles as
+        # arrays instead of the sheet
+        if config.backend == 'numpy':
+            self._compositor = ArrayCompositor(
+                GlyphAtlas.create(self._glyph_factory, config.glyph),
+                spacer_width=config.glyph.spacer_width)
+        elif config.glyph.atlas:
+            self._atlas = GlyphAtlas.create(self._glyph_factory, config.glyph)
+
+        self.row_cache: Optional[RowCache] = RowCache(
+            max_bytes=config.row_cache_bytes,
+            encode=config.row_cache_encode) if config.row_cache_bytes else None
 
         self.spacer_width = config.glyph.spacer_width
 
@@ -32,8 +54,9 @@ class Canvas:
         except GlyphNotFound:
             ...
 
-        glyph = self._glyph_factory.create_glyph(
-            char=char, shape=shape, color=color)
+        # Cutting a tile out of the atlas is far cheaper than rendering one
+        source = self._atlas or self._glyph_factory
+        glyph = source.create_glyph(char=char, shape=shape, color=color)
         self._glyphs.add(glyph)
 
         logging.getLogger('WordleBot.Canvas').debug(
@@ -47,7 +70,26 @@ class Canvas:
             shape: GlyphShape = GlyphShape.DEFAULT) -> Image:
 
         if word is None:
-            return Image(image=PILImage.new('RGBA', (0, 0)))
+            return Image(image=PILImage.new('RGBA', (0, 0)), encoder=self.encoder)
+
+        if self.row_cache is None:
+            return self._draw_word(word, shape)
+
+        key = (tuple(word), shape)
+        image = self.row_cache.get(key)
+        if image is None:
+            image = self._draw_word(word, shape)
+            self.row_cache.put(key, image)
+
+        return image
+
+    def _draw_word(
+            self,
+            word: List[Tuple[str, GlyphColor]],
+            shape: GlyphShape) -> Image:
+
+        if self._compositor:
+            return Image(array=self._compositor.draw_word(word, shape), encoder=self.encoder)
 
         cols = len(word)
 
@@ -69,12 +111,49 @@ class Canvas:
                 (idx % cols) * (glyph.width + self.spacer_width)
             img.paste(glyph.image, (x_off, self.spacer_width))
 
-        return Image(image=img)
+        return Image(image=img, encoder=self.encoder)
+
+    def render(self, drawing: Drawing) -> Image:
+        if len(drawing.rows) == 1:
+            return self.draw_word(list(drawing.rows[0]), shape=drawing.shape)
+
+        if self._compositor:
+            return Image(array=self._compositor.join([
+                self.draw_word(list(row), shape=drawing.shape).array for row in drawing.rows]),
+                encoder=self.encoder)
+
+        board = self.create_board(
+            columns=max(len(row) for row in drawing.rows),
+            rows=len(drawing.rows),
+            shape=drawing.shape)
+
+        for row in drawing.rows:
+            board.append(self.draw_word(list(row), shape=drawing.shape))
+
+        return board.export()
+
+    def create_board(
+            self,
+            columns: int,
+            rows: int,
+            shape: GlyphShape = GlyphShape.DEFAULT) -> Board:
+
+        glyph_width, glyph_height = self._glyph_factory.template(shape).size
+
+        return Board(
+            width=columns * (glyph_width + self.spacer_width) + self.spacer_width,
+            row_height=glyph_height + 2 * self.spacer_width,
+            spacer_width=self.spacer_width,
+            rows=rows,
+            encoder=self.encoder)
 
     def vertical_join(self, images: List[Image]) -> Image:
         if len(images) == 1:
             return images[0]
 
+        if self._compositor and all(im.array is not None for im in images):
+            return Image(array=self._compositor.join([im.array for im in images]), encoder=self.encoder)
+
         width = max([im.width for im in images])
         height = sum(
             [im.height - self.spacer_width for im in images]) + self.spacer_width
@@ -87,4 +166,4 @@ class Canvas:
             res.paste(im.image, (x_offset, y_offset))
             y_offset = y_offset + im.height - self.spacer_width
 
-        return Image(res)
+        return Image(res, encoder=self.encoder)
@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+from typing import Hashable, Optional, Tuple
+
+from Wordle.Canvas.Glyph import GlyphColor, GlyphShape
+
+Row = Tuple[Tuple[str, GlyphColor], ...]
+
+
+@dataclass(frozen=True)
+class Drawing:
+    """
+    Rows of letters and colors to render, small enough to hand to a worker
+    process. Drawings with a key are cached as encoded bytes by the
+    RenderService; the key must identify the rows and shape exactly.
+    """
+    rows: Tuple[Row, ...]
+    shape: GlyphShape = GlyphShape.DEFAULT
+    key: Optional[Hashable] = field(default=None, compare=False)
@@ -0,0 +1,117 @@
+import logging
+import math
+import mmap
+import os
+from typing import Dict, Optional, Tuple
+
+from PIL import Image as PILImage
+
+from Config import GlyphConfig
+
+from .Glyph import Glyph
+from .GlyphColor import GlyphColor
+from .GlyphFactory import GlyphFactory
+from .GlyphShape import GlyphShape
+
+
+class GlyphAtlas:
+    """
+    Every glyph the factory can draw, pre-rendered into one sprite sheet.
+    Each shape gets its own section, laid out left to right, holding one
+    tile per (color, character) in a grid COLUMNS tiles wide.
+
+    The sheet is cached as raw RGBA pixels and memory-mapped on later
+    starts, which skips decoding and lets processes on one host share it.
+    """
+
+    COLUMNS: int = 32
+
+    def __init__(self, factory: GlyphFactory, pixels: Optional[mmap.mmap] = None):
+        self._factory: GlyphFactory = factory
+        self._colors: list = list(GlyphColor)
+        self._chars: Dict[str, int] = {
+            char: i for i, char in enumerate(factory.alphabet)}
+
+        self._sections: Dict[GlyphShape, Tuple[int, int, int]] = {}
+        width, height = 0, 0
+        for shape in GlyphShape:
+            tile_width, tile_height = factory.template(shape).size
+            rows = math.ceil(len(self._colors) * len(self._chars) / GlyphAtlas.COLUMNS)
+
+            self._sections[shape] = (width, tile_width, tile_height)
+            width += GlyphAtlas.COLUMNS * tile_width
+            height = max(height, rows * tile_height)
+
+        self.size: Tuple[int, int] = (width, height)
+
+        # A cached sheet with some other layout is rendered again
+        self.cached: bool = pixels is not None and len(pixels) == width * height * 4
+        self.image: PILImage.Image = PILImage.frombuffer(
+            'RGBA', self.size, pixels, 'raw', 'RGBA', 0, 1) if self.cached else self._render()
+
+    @classmethod
+    def create(cls, factory: GlyphFactory, config: GlyphConfig) -> 'GlyphAtlas':
+        """ Loads the atlas from the cache directory, rendering and saving it on a miss """
+        logger = logging.getLogger('WordleBot.Canvas')
+
+        path = None
+        if config.cache_dir:
+            path = os.path.join(
+                config.cache_dir, f'glyph-atlas-{GlyphFactory.cache_key(config)}.rgba')
+
+        atlas = cls(factory, pixels=GlyphAtlas._map(path) if path else None)
+        if atlas.cached:
+            logger.debug(f'Mapped glyph atlas from {path}')
+            return atlas
+
+        logger.debug(f'Rendered {atlas.size[0]}x{atlas.size[1]} glyph atlas')
+
+        if path:
+            os.makedirs(config.cache_dir, exist_ok=True)
+            staging = f'{path}.{os.getpid()}.tmp'
+            with open(staging, 'wb') as stream:
+                stream.write(atlas.image.tobytes())
+            os.replace(staging, path)
+
+        return atlas
+
+    @staticmethod
+    def _map(path: str) -> Optional[mmap.mmap]:
+        try:
+            with open(path, 'rb') as stream:
+                return mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+    def _render(self) -> PILImage.Image:
+        sheet = PILImage.new('RGBA', self.size)
+        for shape in GlyphShape:
+            for color in self._colors:
+                for char in self._chars:
+                    glyph = self._factory.create_glyph(char=char, color=color, shape=shape)
+                    sheet.paste(glyph.image, self.box(char, shape, color)[:2])
+        return sheet
+
+    @property
+    def chars(self) -> list[str]:
+        return list(self._chars)
+
+    def section(self, shape: GlyphShape) -> Tuple[int, int, int]:
+        """ x offset, tile width and tile height of a shape's part of the sheet """
+        return self._sections[shape]
+
+    def resolve(self, char: str, color: GlyphColor) -> Tuple[str, GlyphColor]:
+        return self._factory.resolve(char, color)
+
+    def box(self, char: str, shape: GlyphShape, color: GlyphColor) -> Tuple[int, int, int, int]:
+        x_offset, tile_width, tile_height = self._sections[shape]
+        n = self._colors.index(color) * len(self._chars) + self._chars[char]
+
+        x = x_offset + (n % GlyphAtlas.COLUMNS) * tile_width
+        y = (n // GlyphAtlas.COLUMNS) * tile_height
+        return x, y, x + tile_width, y + tile_height
+
+    def create_glyph(self, char: str, color: GlyphColor, shape: GlyphShape) -> Glyph:
+        char, color = self._factory.resolve(char, color)
+        return Glyph(name=char, image=self.image.crop(self.box(char, shape, color)),
+                     font=self._factory.template(shape).font, shape=shape, color=color)
@@ -1,6 +1,9 @@
+import hashlib
+import json
 import math
+import os
 import string
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 from PIL import ImageDraw
 from PIL import Image as PILImage
@@ -14,14 +17,22 @@ from .GlyphTemplate import GlyphTemplate
 
 
 class GlyphFactory:
+    ALPHABET: str = ' ' + string.digits + string.ascii_letters + string.punctuation
+
     def __init__(self, config: GlyphConfig):
-        self._alphabet: str = ' ' + string.digits + \
-            string.ascii_letters + string.punctuation
+        self._alphabet: str = GlyphFactory.ALPHABET
         self._error_char = '?'
         self._error_color = GlyphColor.RED
 
         assert self._error_char in self._alphabet
 
+        path = None
+        if config.cache_dir:
+            path = os.path.join(
+                config.cache_dir, f'glyph-metrics-{GlyphFactory.cache_key(config)}.json')
+
+        metrics = GlyphFactory._load_metrics(path)
+
         self._templates: Dict[GlyphShape] = {
             GlyphShape.DEFAULT: GlyphTemplate(
                 alphabet=self._alphabet,
@@ -30,7 +41,8 @@ class GlyphFactory:
                 horizontal_pad=config.horizontal_pad,
                 vertical_pad=config.vertical_pad,
                 border_width=config.border_width,
-                square=config.square),
+                square=config.square,
+                metrics=metrics.get(GlyphShape.DEFAULT.name)),
             GlyphShape.WIDE: GlyphTemplate(
                 alphabet=self._alphabet,
                 font_path=config.font_path,
@@ -38,7 +50,55 @@ class GlyphFactory:
                 horizontal_pad=config.wide_horizontal_pad,
                 vertical_pad=config.wide_vertical_pad,
                 border_width=config.border_width,
-                square=False)}
+                square=False,
+                metrics=metrics.get(GlyphShape.WIDE.name))}
+
+        if path and not metrics:
+            GlyphFactory._save_metrics(path, {
+                shape.name: tpl.metrics for shape, tpl in self._templates.items()})
+
+    @staticmethod
+    def cache_key(config: GlyphConfig) -> str:
+        """ Identifies everything that changes how glyphs look """
+        digest = hashlib.sha256(config.json(
+            exclude={'atlas', 'cache_dir'}, sort_keys=True).encode())
+
+        with open(config.font_path, 'rb') as font:
+            digest.update(font.read())
+
+        digest.update(GlyphFactory.ALPHABET.encode())
+        digest.update(''.join(f'{c.name}{c.value}' for c in GlyphColor).encode())
+        digest.update(''.join(s.name for s in GlyphShape).encode())
+        return digest.hexdigest()[:16]
+
+    @staticmethod
+    def _load_metrics(path: Optional[str]) -> Dict[str, Dict[str, int]]:
+        try:
+            with open(path) as stream:
+                return json.load(stream)
+        except (TypeError, OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_metrics(path: str, metrics: Dict[str, Dict[str, int]]):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        staging = f'{path}.{os.getpid()}.tmp'
+        with open(staging, 'w') as stream:
+            json.dump(metrics, stream)
+        os.replace(staging, path)
+
+    @property
+    def alphabet(self) -> str:
+        return self._alphabet
+
+    def template(self, shape: GlyphShape) -> GlyphTemplate:
+        return self._templates[shape]
+
+    def resolve(self, char: str, color: GlyphColor) -> Tuple[str, GlyphColor]:
+        """ Substitutes the error glyph for characters outside the alphabet """
+        if char not in self._alphabet:
+            return self._error_char, self._error_color
+        return char, color
 
     def create_glyph(self,
                      char: str,
@@ -47,9 +107,7 @@ class GlyphFactory:
 
         tpl = self._templates[shape]
 
-        if char not in self._alphabet:
-            char = self._error_char
-            color = self._error_color
+        char, color = self.resolve(char, color)
 
         fill_color = color.value[0]
         border_color = color.value[1]
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 import math
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
 from .GlyphFont import GlyphFont
 
@@ -19,10 +19,22 @@ class GlyphTemplate:
                  horizontal_pad: int,
                  vertical_pad: int,
                  border_width: int,
-                 square: bool):
+                 square: bool,
+                 metrics: Optional[Dict[str, int]] = None):
 
         font = GlyphFont(font_path=font_path, size=font_size)
 
+        self.font = font
+        self.alphabet = alphabet
+        self.border_width = border_width
+
+        # Measured by an earlier start with the same font and settings
+        if metrics:
+            self.width = metrics['width']
+            self.height = metrics['height']
+            self.vertical_offset = metrics['vertical_offset']
+            return
+
         bbox_sizes = [font.getbbox(char) for char in alphabet]
         x1 = min([bbox[0] for bbox in bbox_sizes])
         y1 = min([bbox[1] for bbox in bbox_sizes])
@@ -40,15 +52,17 @@ class GlyphTemplate:
         char_heights = [bbox[3] - bbox[1] for bbox in bbox_sizes]
         mode_char_height = max(char_heights, key=char_heights.count)
 
-        self.font = font
-        self.alphabet = alphabet
         self.width = max(glyph_width, glyph_height) if square else glyph_width
         self.height = max(
             glyph_width, glyph_height) if square else glyph_height
 
-        self.border_width = border_width
         self.vertical_offset = int((self.height - mode_char_height) / 2)
 
+    @property
+    def metrics(self) -> Dict[str, int]:
+        return {'width': self.width, 'height': self.height,
+                'vertical_offset': self.vertical_offset}
+
     @property
     def size(self) -> Tuple[int, int]:
         return self.width, self.height
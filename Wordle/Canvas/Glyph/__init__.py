@@ -4,5 +4,6 @@ from .GlyphShape import GlyphShape
 
 from .GlyphCollection import GlyphCollection
 from .GlyphFactory import GlyphFactory
+from .GlyphAtlas import GlyphAtlas
 
 from .GlyphError import GlyphError, GlyphNotFound
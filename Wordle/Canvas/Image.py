@@ -1,18 +1,32 @@
 import uuid
 
 from io import BytesIO
+from typing import TYPE_CHECKING, Optional
 
+import numpy as np
 from discord import File
 
 from PIL import Image as PILImage
 
+if TYPE_CHECKING:
+    from Wordle.Canvas.ImageEncoder import ImageEncoder
+
 
 class Image():
-    def __init__(self, image: PILImage, format: str = 'png'):
+    def __init__(self,
+                 image: Optional[PILImage.Image] = None,
+                 format: Optional[str] = None,
+                 array: Optional[np.ndarray] = None,
+                 encoder: Optional['ImageEncoder'] = None):
         self.id: str = str(uuid.uuid4())
-        self.image: PILImage = image
+        self._image: Optional[PILImage.Image] = image
+        # RGBA pixels from the numpy canvas backend, only made into a PIL image when asked for
+        self.array: Optional[np.ndarray] = array
         # self.border_width: int = border_width
-        self.format: str = format
+        # Falls back to a plain PIL save without the canvas' encoder
+        self.encoder: Optional['ImageEncoder'] = encoder
+        self.format: str = format or (encoder.format if encoder else 'png')
+        self.encoded: Optional[bytes] = None
 
     def __str__(self):
         return '.'.join([self.id, self.format])
@@ -21,16 +35,37 @@ class Image():
     def name(self) -> str:
         return '.'.join([self.id, self.format])
 
+    @property
+    def image(self) -> PILImage.Image:
+        if self._image is None:
+            self._image = PILImage.fromarray(self.array, 'RGBA')
+        return self._image
+
     @property
     def width(self) -> int:
-        return self.image.width
+        return self.array.shape[1] if self.array is not None else self._image.width
 
     @property
     def height(self) -> int:
-        return self.image.height
+        return self.array.shape[0] if self.array is not None else self._image.height
+
+    @property
+    def nbytes(self) -> int:
+        pixels = self.array.nbytes if self.array is not None else \
+            self.width * self.height * len(self._image.getbands())
+        return pixels + len(self.encoded or b'')
+
+    def encode(self) -> bytes:
+        """ Encodes the image once; later calls return the same bytes """
+        if self.encoded is None and self.encoder:
+            self.encoded = self.encoder.encode(
+                self.array if self.array is not None else self.image, self.format)
+        elif self.encoded is None:
+            arr = BytesIO()
+            self.image.save(arr, format=self.format)
+            self.encoded = arr.getvalue()
+
+        return self.encoded
 
     def to_discord_file(self) -> File:
-        arr = BytesIO()
-        self.image.save(arr, format=self.format)
-        arr.seek(0)
-        return File(arr, self.name)
+        return File(BytesIO(self.encode()), self.name)
@@ -0,0 +1,115 @@
+from io import BytesIO
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from PIL import Image as PILImage
+from PIL import ImageColor
+
+from Config import EncodingConfig
+
+from Wordle.Canvas.Glyph import GlyphColor
+
+
+class ImageEncoder:
+    """
+    Turns canvas images into file bytes. Boards only ever contain the
+    GlyphColor fills and fonts plus the anti-aliased edges between them,
+    so PNGs can be written as 8-bit palette images against a fixed palette
+    of ramps from each fill to its font.
+    """
+
+    _palette: Optional[np.ndarray] = None
+    _lookup: Tuple[np.ndarray, np.ndarray] = (
+        np.zeros(1, dtype=np.uint32), np.zeros(1, dtype=np.uint8))
+
+    def __init__(self, config: EncodingConfig = EncodingConfig()):
+        self.format: str = config.format
+        self.palette: bool = config.palette
+        self.compress_level: int = config.compress_level
+        self.lossless: bool = config.lossless
+        self.quality: int = config.quality
+        self.method: int = config.method
+
+    @staticmethod
+    def palette_colors() -> np.ndarray:
+        """ RGBA palette entries: transparent, then a ramp per GlyphColor """
+        if ImageEncoder._palette is not None:
+            return ImageEncoder._palette
+
+        pairs = []
+        for color in GlyphColor:
+            fill, font = (np.array(ImageColor.getrgb(c), dtype=np.float64)
+                          for c in (color.value[0], color.value[2]))
+
+            # Text on a transparent fill keeps the font's color and only fades
+            if fill[3] == 0:
+                fill[:3] = font[:3]
+
+            if not np.array_equal(fill, font) and \
+                    not any(np.array_equal(fill, f) and np.array_equal(font, t) for f, t in pairs):
+                pairs.append((fill, font))
+
+        steps = 255 // len(pairs)
+        ramps = [fill + (font - fill) * np.linspace(0, 1, steps)[:, None]
+                 for fill, font in pairs]
+
+        ImageEncoder._palette = np.concatenate(
+            [np.zeros((1, 4)), *ramps]).round().astype(np.uint8)
+        return ImageEncoder._palette
+
+    @staticmethod
+    def nearest(colors: np.ndarray) -> np.ndarray:
+        """ Palette index closest to each packed RGBA color """
+        palette = ImageEncoder.palette_colors().astype(np.int32)
+        distances = ((colors.view(np.uint8).reshape(-1, 1, 4).astype(np.int32) -
+                      palette) ** 2).sum(axis=2)
+        return distances.argmin(axis=1).astype(np.uint8)
+
+    def quantize(self, image: Union[PILImage.Image, np.ndarray]) -> PILImage.Image:
+        """ Maps every pixel to the nearest palette entry """
+        pixels = image if isinstance(image, np.ndarray) else np.asarray(image.convert('RGBA'))
+        pixels = np.ascontiguousarray(pixels)
+        flat = pixels.reshape(-1, 4).view(np.uint32).ravel()
+
+        # Every color seen so far is remembered with its palette index, the
+        # boards only ever draw from a few thousand
+        colors, indices = ImageEncoder._lookup
+        positions = np.minimum(np.searchsorted(colors, flat), len(colors) - 1)
+
+        unknown = colors[positions] != flat
+        if unknown.any():
+            colors = np.union1d(colors, flat[unknown])
+            indices = ImageEncoder.nearest(colors)
+            ImageEncoder._lookup = colors, indices
+            positions = np.searchsorted(colors, flat)
+
+        palette = ImageEncoder.palette_colors()
+        quantized = PILImage.fromarray(
+            indices[positions].reshape(pixels.shape[:2]), 'P')
+        quantized.putpalette(palette[:, :3].tobytes())
+        quantized.info['transparency'] = palette[:, 3].tobytes()
+        return quantized
+
+    def encode(self, image: Union[PILImage.Image, np.ndarray], format: Optional[str] = None) -> bytes:
+        format = format or self.format
+        arr = BytesIO()
+
+        empty = image.size == 0 if isinstance(image, np.ndarray) else 0 in image.size
+        if format == 'png' and self.palette and not empty:
+            quantized = self.quantize(image)
+            quantized.save(arr, format='png', compress_level=self.compress_level,
+                           transparency=quantized.info['transparency'])
+            return arr.getvalue()
+
+        if isinstance(image, np.ndarray):
+            image = PILImage.fromarray(image, 'RGBA')
+
+        if format == 'webp':
+            image.save(arr, format='webp', lossless=self.lossless,
+                       quality=self.quality, method=self.method)
+        elif format == 'png':
+            image.save(arr, format='png', compress_level=self.compress_level)
+        else:
+            image.save(arr, format=format)
+
+        return arr.getvalue()
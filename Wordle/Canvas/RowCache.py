@@ -0,0 +1,79 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from Wordle.Canvas.Image import Image
+
+
+class RowCache:
+    """
+    Least recently used cache of rendered rows, bounded by the bytes held
+    in pixels and encoded files. Cached images are shared between games
+    and must not be drawn on.
+    """
+
+    def __init__(self, max_bytes: int, encode: bool = False):
+        self.max_bytes: int = max_bytes
+        self.encode: bool = encode
+        self.size: int = 0
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+        self._rows: OrderedDict[Hashable, Tuple[Image, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __str__(self) -> str:
+        lookups = self.hits + self.misses
+        return (f'{len(self)} rows ({self.size} bytes), {self.hits} hits, '
+                f'{self.misses} misses ({self.hits / max(lookups, 1):.2%} hit rate), '
+                f'{self.evictions} evictions')
+
+    def get(self, key: Hashable) -> Optional[Image]:
+        with self._lock:
+            try:
+                image, size = self._rows[key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._rows.move_to_end(key)
+
+            # The image may have been encoded since it was cached
+            if image.nbytes != size:
+                self._rows[key] = image, image.nbytes
+                self.size += image.nbytes - size
+                self._evict()
+
+            return image
+
+    def put(self, key: Hashable, image: Image):
+        if self.encode:
+            image.encode()
+
+        if image.nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._rows:
+                self.size -= self._rows.pop(key)[1]
+
+            self._rows[key] = image, image.nbytes
+            self.size += image.nbytes
+            self._evict()
+
+    def _evict(self):
+        while self.size > self.max_bytes:
+            _, (_, size) = self._rows.popitem(last=False)
+            self.size -= size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._rows.clear()
+            self.size = 0
@@ -1,2 +1,6 @@
 from .Canvas import Canvas
 from .Image import Image
+from .ImageEncoder import ImageEncoder
+from .Board import Board
+from .Drawing import Drawing
+from .RowCache import RowCache
@@ -0,0 +1,129 @@
+import string
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+class Feedback:
+    """
+    Vectorized Wordle feedback. A guess scored against an answer yields one
+    state per letter, packed into a base-3 pattern code where position i
+    contributes state * 3 ** i.
+    """
+
+    ABSENT: int = 0
+    PRESENT: int = 1
+    CORRECT: int = 2
+
+    # Guess rows scored per step in matrix(); bounds the (rows, answers,
+    # length) working set
+    CHUNK_SIZE: int = 64
+
+    _symbols: Dict[str, int] = {
+        letter: i for i, letter in enumerate(string.ascii_lowercase)}
+    _matrices: Dict[int, Tuple[Dict[str, int], np.ndarray]] = {}
+
+    @staticmethod
+    def dtype(length: int) -> type:
+        if 3 ** length <= 2 ** 8:
+            return np.uint8
+        if 3 ** length <= 2 ** 16:
+            return np.uint16
+        if 3 ** length <= 2 ** 32:
+            return np.uint32
+        return np.uint64
+
+    @staticmethod
+    def encode(words: Sequence[str]) -> np.ndarray:
+        """ Encodes equal-length words as a (words, length) uint8 array """
+        length = len(words[0]) if words else 0
+        joined = ''.join(words)
+
+        if joined.isascii() and joined.isalpha() and joined.islower():
+            codes = np.frombuffer(joined.encode(), dtype=np.uint8) - ord('a')
+            return codes.reshape(len(words), length)
+
+        for char in set(joined) - Feedback._symbols.keys():
+            Feedback._symbols[char] = len(Feedback._symbols)
+
+        return np.array(
+            [[Feedback._symbols[char] for char in word] for word in words],
+            dtype=np.uint8).reshape(len(words), length)
+
+    @staticmethod
+    def decode(code: int, length: int) -> List[int]:
+        states = []
+        for _ in range(length):
+            code, state = divmod(int(code), 3)
+            states.append(state)
+        return states
+
+    @staticmethod
+    def matrix(guesses: np.ndarray, answers: np.ndarray) -> np.ndarray:
+        """ Pattern codes for every encoded guess against every encoded answer """
+        length = guesses.shape[1]
+        dtype = Feedback.dtype(length)
+        weights = (3 ** np.arange(length)).astype(dtype)
+        earlier = np.tri(length, length, -1, dtype=np.float32)
+
+        symbols = int(max(guesses.max(initial=0), answers.max(initial=0))) + 1
+        totals = np.zeros((len(answers), symbols), dtype=np.float32)
+        for k in range(length):
+            totals[np.arange(len(answers)), answers[:, k]] += 1
+
+        result = np.empty((len(guesses), len(answers)), dtype=dtype)
+
+        for start in range(0, len(guesses), Feedback.CHUNK_SIZE):
+            chunk = guesses[start:start + Feedback.CHUNK_SIZE]
+
+            green = chunk[:, None, :] == answers[None, :, :]
+            same = (chunk[:, :, None] == chunk[:, None, :]).astype(np.float32)
+
+            # A guess letter is yellow while the answer still has copies of
+            # it that are neither green nor claimed by an earlier non-green
+            # guess position, which mirrors the left-to-right scan
+            available = totals[:, chunk].transpose(1, 0, 2) - \
+                green.astype(np.float32) @ same.transpose(0, 2, 1)
+            claimed = (~green).astype(np.float32) @ (same * earlier).transpose(0, 2, 1)
+
+            yellow = ~green & (available > claimed)
+
+            codes = green.astype(dtype) * Feedback.CORRECT + yellow.astype(dtype) * Feedback.PRESENT
+            result[start:start + len(chunk)] = codes @ weights
+
+        return result
+
+    @staticmethod
+    def patterns(guess: str, answers: np.ndarray) -> np.ndarray:
+        """ Pattern codes for one guess against many encoded answers """
+        return Feedback.matrix(Feedback.encode([guess]), answers)[0]
+
+    @staticmethod
+    def precompute(length: int, words: Sequence[str]) -> np.ndarray:
+        """ Caches the full guess x answer matrix for a word length """
+        matrix = Feedback.matrix(Feedback.encode(words), Feedback.encode(words))
+        Feedback._matrices[length] = ({word: i for i, word in enumerate(words)}, matrix)
+        return matrix
+
+    @staticmethod
+    def pattern(guess: str, answer: str) -> int:
+        """ Pattern code for a single pair, from the cached matrix if present """
+        cached = Feedback._matrices.get(len(guess))
+        if cached:
+            rows, matrix = cached
+            if guess in rows and answer in rows:
+                return int(matrix[rows[guess], rows[answer]])
+
+        # A single pair is cheaper to score in Python than through NumPy
+        remaining = Counter(a for g, a in zip(guess, answer) if g != a)
+
+        code = 0
+        for i, (g, a) in enumerate(zip(guess, answer)):
+            if g == a:
+                code += Feedback.CORRECT * 3 ** i
+            elif remaining[g]:
+                remaining[g] -= 1
+                code += Feedback.PRESENT * 3 ** i
+
+        return code
@@ -2,9 +2,11 @@ import string
 from typing import Dict, Optional
 
 from Helpers.RandomText import RandomText
+from Wordle.CandidateSet import CandidateSet
+from Wordle.Feedback import Feedback
 from Wordle.Word import Word
-from Wordle.Words import Words
-from Wordle.Canvas import Canvas, Image
+from Wordle.WordsService import WordsService
+from Wordle.Canvas import Drawing
 from Wordle.Canvas.Glyph import GlyphColor, GlyphShape
 
 
@@ -20,38 +22,148 @@ class Game:
 
     CHAR_WHITELIST = []
 
-    def __init__(self, mode: str, word_length: int = 5, canvas: Optional[Canvas] = None):
+    FEEDBACK_STATUS: Dict[int, str] = {
+        Feedback.CORRECT: CORRECT,
+        Feedback.PRESENT: INCORRECT,
+        Feedback.ABSENT: INVALID}
+
+    # Letter states are packed two bits per letter, indexed by these codes
+    LETTER_STATUS: list[Optional[str]] = [None, INVALID, INCORRECT, CORRECT]
+
+    # Guesses are kept as one fixed-width string, letter states and known
+    # target positions as bitmasks. Images are described as Drawings and
+    # rendered by a RenderService. The version is the store's count of
+    # writes when the game was read and is not part of the state.
+    __slots__ = ('target', 'mode', 'words', 'limit', 'candidates', 'version',
+                 '_guesses', '_letters', '_known')
+
+    def __init__(self,
+                 mode: str,
+                 word_length: int = 5,
+                 words: Optional[WordsService] = None):
         self.target: Optional[Word] = None
         self.mode: str = mode
-        self.canvas: Canvas = canvas
-        self.guesses: list = []
-        self.progress: Optional[Image] = None
+        self.words: WordsService = words
         self.limit: int = self.get_limit_for_length(word_length)
-        self.letter_status: Dict[str, Optional[str]] = {
-            letter: None for letter in string.ascii_lowercase}
-        self.target_progress: list[Optional[str]] = [None] * word_length
+        self.candidates: Optional[CandidateSet] = None
+        self.version: int = 0
 
-        self.generate_target(word_length=word_length, mode=mode)
+        self._guesses: str = ''
+        self._letters: int = 0
+        self._known: int = 0
 
     def __getstate__(self) -> dict:
-        state = self.__dict__.copy()
-        del state['canvas']
-        return state
-
-    def generate_target(self, word_length: int, mode: str):
+        return {
+            'target': self.target,
+            'mode': self.mode,
+            'limit': self.limit,
+            'candidates': self.candidates,
+            'guesses': self._guesses,
+            'letters': self._letters,
+            'known': self._known}
+
+    def __setstate__(self, state: dict):
+        self.words = None
+        self.version = 0
+        self.target = state['target']
+        self.mode = state['mode']
+        self.limit = state['limit']
+        self.candidates = state.get('candidates')
+
+        if 'letter_status' not in state:
+            self._guesses = state['guesses']
+            self._letters = state['letters']
+            self._known = state['known']
+            return
+
+        # Games pickled before the compact layout
+        self._guesses = ''.join(state['guesses'])
+        self._letters = 0
+        self._known = 0
+
+        for letter, status in state['letter_status'].items():
+            self.set_letter_status(letter, status)
+
+        for i, letter in enumerate(state['target_progress']):
+            if letter:
+                self._known |= 1 << i
+
+    @classmethod
+    def from_state(cls, state: dict) -> 'Game':
+        game = cls.__new__(cls)
+        game.__setstate__(state)
+        return game
+
+    @property
+    def guesses(self) -> list[str]:
+        if not self._guesses:
+            return []
+
+        length = len(self.target)
+        return [self._guesses[i:i + length] for i in range(0, len(self._guesses), length)]
+
+    @guesses.setter
+    def guesses(self, guesses: list[str]):
+        self._guesses = ''.join(guesses)
+
+    @property
+    def letter_status(self) -> Dict[str, Optional[str]]:
+        return {letter: self.LETTER_STATUS[(self._letters >> 2 * i) & 3]
+                for i, letter in enumerate(string.ascii_lowercase)}
+
+    def set_letter_status(self, letter: str, status: Optional[str]):
+        shift = 2 * string.ascii_lowercase.index(letter)
+        self._letters = self._letters & ~(3 << shift) | \
+            self.LETTER_STATUS.index(status) << shift
+
+    @property
+    def target_progress(self) -> list[Optional[str]]:
+        return [letter if self._known >> i & 1 else None
+                for i, letter in enumerate(self.target.word)]
+
+    @property
+    def progress(self) -> Optional[Drawing]:
+        guesses = self.guesses
+        if not guesses:
+            return None
+
+        # Scoring only depends on the target, so any game with the same
+        # guesses at it shares the board, and re-sends never re-encode it
+        return Drawing(rows=tuple(
+            tuple(self.colorize(self.score_word(guess))) for guess in guesses),
+            key=('progress', self.target.word, tuple(guesses)))
+
+    async def generate_target(self, word_length: int, mode: str):
         if mode == Game.PUZZLE:
-            targets = Words.get_random(word_length, self.limit)
+            targets = await self.words.get_random(word_length, self.limit)
             self.target = targets[0]
             self.guesses = [word.word for word in targets[1:]]
-            self.progress = self.canvas.vertical_join(
-                images=[self.draw_word(guess) for guess in self.guesses])
+            for guess in self.guesses:
+                self.check_word(guess)
         else:
-            self.target = Words.get_random(word_length)[0]
+            self.target = (await self.words.get_random(word_length))[0]
+
+    def history(self) -> tuple:
+        return tuple((guess, Feedback.pattern(guess, self.target.word))
+                     for guess in self.guesses)
+
+    async def get_candidates(self) -> CandidateSet:
+        """ Rebuilds the candidates from the guesses for games stored without them """
+        self.candidates = await self.words.candidates(
+            len(self.target), self.history(), getattr(self, 'candidates', None))
+        return self.candidates
+
+    async def remaining(self) -> int:
+        return len(await self.get_candidates())
+
+    async def suggest(self):
+        suggestion = await self.words.suggest(len(self.target), await self.get_candidates())
+        if suggestion is None:
+            return (await self.words.get_random(len(self.target)))[0].word
 
-    def suggest(self):
-        return Words.get_random(len(self.target))[0].word
+        return suggestion
 
-    def guess(self, word: str, author_id: int) -> tuple:
+    async def guess(self, word: str, author_id: int) -> tuple:
         if not word or len(word) != len(self.target):
             return self.INVALID, f'Your guesses must be {len(self.target)} letters long.', None
 
@@ -60,15 +172,16 @@ class Game:
         if any(letter for letter in lowered_word if letter not in string.ascii_lowercase):
             return self.INVALID, f'{word} contains illegal characters, you {RandomText.idiot(author_id)}', None
 
-        if lowered_word != self.target.word and self.mode != self.PUZZLE and not Words.get_by_word(lowered_word):
+        if lowered_word != self.target.word and self.mode != self.PUZZLE and not await self.words.contains(lowered_word):
             return self.INVALID, f'{word} is not a word, you {RandomText.idiot(author_id)}', None
 
         image = self.draw_word(lowered_word)
 
         if lowered_word not in self.guesses:
-            self.guesses.append(lowered_word)
-            self.progress = self.canvas.vertical_join(
-                images=list(filter(None, [self.progress, image])))
+            self.candidates = await self.words.narrow(
+                len(self.target), await self.get_candidates(),
+                lowered_word, Feedback.pattern(lowered_word, self.target.word))
+            self._guesses += lowered_word
 
         if lowered_word == self.target.word:
             if self.mode == Game.PUZZLE:
@@ -99,64 +212,63 @@ class Game:
 
         return self.INCORRECT, None, image
 
-    def draw_unused_letters(self):
+    def draw_unused_letters(self) -> Drawing:
         rows = ['qwertyuiop', 'asdfghjkl', 'zxcvbnm']
 
-        words = [[(letter.upper(), self.status_color(self.letter_status[letter]))
+        letter_status = self.letter_status
+        words = [[(letter.upper(), self.status_color(letter_status[letter]))
                   for letter in row] for row in rows]
 
         # Insert a blank character to shift the bottom row left
         words[2].append((' ', GlyphColor.CLEAR))
 
-        return self.canvas.vertical_join([
-            self.canvas.draw_word(word=word, shape=GlyphShape.WIDE) for word in words])
+        # The keyboard only depends on the packed letter states
+        return Drawing(rows=tuple(tuple(word) for word in words), shape=GlyphShape.WIDE,
+                       key=('keyboard', self._letters))
 
-    def draw_known_letters(self):
-        return self.canvas.draw_word(
-            word=[(letter.upper(), self.status_color(self.CORRECT)) if letter else (
-                ' ', self.status_color(self.INVALID)) for letter in self.target_progress])
+    def draw_known_letters(self) -> Drawing:
+        return Drawing(rows=(tuple(
+            (letter.upper(), self.status_color(self.CORRECT)) if letter else (
+                ' ', self.status_color(self.INVALID)) for letter in self.target_progress),))
 
-    def draw_word(self, word: str):
-        guess_map = self.check_word(word)
+    def draw_word(self, word: str) -> Drawing:
+        return Drawing(rows=(tuple(self.colorize(self.check_word(word))),))
 
-        word = [(letter['letter'].upper(), self.status_color(letter['status']))
+    def colorize(self, guess_map: list) -> list:
+        return [(letter['letter'].upper(), self.status_color(letter['status']))
                 for letter in guess_map]
 
-        return self.canvas.draw_word(word)
+    def score_word(self, word) -> list:
+        states = Feedback.decode(
+            Feedback.pattern(word, self.target.word), len(word))
 
-    def check_word(self, word):
-        target_map: list = [None if letter == word[i]
-                            else letter for i, letter in enumerate(self.target.word)]
+        return [{'letter': letter, 'status': self.FEEDBACK_STATUS[state]}
+                for letter, state in zip(word, states)]
 
-        guess_map: list = [{'letter': letter, 'status': None} if target_map[i] else {
-            'letter': letter, 'status': self.CORRECT} for i, letter in enumerate(word)]
+    def check_word(self, word):
+        guess_map = self.score_word(word)
+        letter_status = self.letter_status
 
         for i, letter in enumerate(guess_map):
             if letter['status'] == self.CORRECT:
-                self.target_progress[i] = letter['letter']
-                continue
-
-            if letter['letter'] in target_map:
-                target_map[target_map.index(letter['letter'])] = None
-                guess_map[i]['status'] = self.INCORRECT
-                continue
-
-            guess_map[i]['status'] = self.INVALID
+                self._known |= 1 << i
 
         for item in guess_map:
             letter = item['letter']
             status = item['status']
-            existing = self.letter_status[letter]
+            existing = letter_status[letter]
 
             if existing is None:
-                self.letter_status[letter] = status
+                letter_status[letter] = status
+                self.set_letter_status(letter, status)
                 continue
 
             if existing == self.CORRECT:
                 continue
 
             if status in [self.CORRECT, self.INCORRECT]:
-                self.letter_status[letter] = status
+                letter_status[letter] = status
+                self.set_letter_status(letter, status)
                 continue
 
         return guess_map
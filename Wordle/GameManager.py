@@ -1,26 +1,34 @@
+import asyncio
+import random
 from contextlib import asynccontextmanager
 
 from discord import TextChannel, DMChannel
 
-from Config import CanvasConfig
-
-from Wordle.Canvas import Canvas
 from Wordle.Game import Game
 from Wordle.Lock import Lock
-from Wordle.Store import Store
+from Wordle.Store import GameConflictError, Store
+from Wordle.WordsService import WordsService
 
 
 class GameManager:
-    def __init__(self, canvas_config: CanvasConfig, backend: Store):
+    # Upper bound of the first random pause before rereading a game after a
+    # conflict; it doubles on every further attempt
+    RETRY_DELAY: float = 0.002
+
+    def __init__(self, backend: Store, words: WordsService, retries: int = 5):
         self.store: Store = backend
-        self.canvas: Canvas = Canvas(canvas_config)
+        self.words: WordsService = words
+        self.retries: int = retries
 
     @staticmethod
     def server_id(channel: TextChannel) -> int:
         return channel.guild.id if not isinstance(channel, DMChannel) else 0
 
-    def create_game(self, word_length: int, mode: str) -> Game:
-        return Game(word_length=word_length, mode=mode, canvas=self.canvas)
+    async def create_game(self, word_length: int, mode: str) -> Game:
+        game = Game(word_length=word_length, mode=mode, words=self.words)
+        await game.generate_target(word_length=word_length, mode=mode)
+
+        return game
 
     @asynccontextmanager
     async def lock(self, channel: TextChannel) -> Lock:
@@ -35,8 +43,8 @@ class GameManager:
     async def get_current_game(self, channel: TextChannel) -> Game:
         """ raises GameNotFoundError """
         game = await self.store.get_game(GameManager.server_id(channel), channel.id)
-        if not hasattr(game, 'canvas') or game.canvas is None:
-            game.canvas = self.canvas
+        if not hasattr(game, 'words') or game.words is None:
+            game.words = self.words
 
         return game
 
@@ -46,3 +54,41 @@ class GameManager:
     async def update_game(self, channel: TextChannel, game: Game) -> Game:
         """ raises GameNotFoundError """
         return await self.store.update_game(GameManager.server_id(channel), channel.id, game)
+
+    async def commit_game(self, channel: TextChannel, game: Game, finish: bool = False) -> Game:
+        """ raises GameNotFoundError, GameConflictError """
+        return await self.store.commit_game(GameManager.server_id(channel), channel.id, game, finish)
+
+    async def _guess(self, channel: TextChannel, word: str, author_id: int) -> tuple:
+        """ raises GameNotFoundError, GameConflictError """
+        game = await self.get_current_game(channel)
+        status, message, image = await game.guess(word, author_id=author_id)
+
+        if status != Game.INVALID:
+            await self.commit_game(channel, game, finish=status in [Game.CORRECT, Game.FAILED])
+        return status, message, image
+
+    async def guess(self, channel: TextChannel, word: str, author_id: int) -> tuple:
+        """
+        Applies a guess to the latest game and commits it, starting over
+        from a fresh read whenever another guess was committed first. After
+        retries conflicts the guess waits for the channel lock instead, so
+        it is never given up on.
+        raises GameNotFoundError, LockNotFoundError
+        """
+        for attempt in range(self.retries):
+            try:
+                return await self._guess(channel, word, author_id)
+            except GameConflictError:
+                ...
+
+            await asyncio.sleep(random.uniform(0, GameManager.RETRY_DELAY * 2 ** attempt))
+
+        # Only guessers still on their optimistic attempts can beat the
+        # lock holder, and each conflict means one of them committed
+        async with self.lock(channel):
+            while True:
+                try:
+                    return await self._guess(channel, word, author_id)
+                except GameConflictError:
+                    ...
@@ -0,0 +1,110 @@
+import asyncio
+import multiprocessing
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+from typing import Hashable, Optional
+
+from discord import File
+
+from Config import CanvasConfig
+from Wordle.Canvas import Canvas, Drawing
+
+# The canvas of a render worker process, warmed once by _initialize
+_canvas: Optional[Canvas] = None
+
+
+def _initialize(config: CanvasConfig):
+    global _canvas
+    _canvas = Canvas(config)
+
+
+def _render(drawing: Drawing) -> bytes:
+    return _canvas.render(drawing).encode()
+
+
+class RenderService:
+    """
+    Async front for Canvas that keeps drawing and encoding off the event
+    loop. 'thread' shares one canvas between a pool of threads, 'process'
+    gives each worker process its own warmed canvas and only sends
+    Drawings and encoded bytes between them, and 'inline' renders on the
+    loop itself.
+
+    Keyed drawings, such as the %hint keyboard, are kept as encoded bytes
+    in a least recently used cache shared by every game, so repeats never
+    leave the loop.
+    """
+
+    def __init__(self, config: CanvasConfig, executor: str = 'thread', pool_size: int = 2):
+        self.format: str = config.encoding.format
+        self.canvas: Optional[Canvas] = None
+        self._executor: Optional[Executor] = None
+
+        self.cache_bytes: int = config.render_cache_bytes
+        self.cache_size: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self._cache: OrderedDict[Hashable, bytes] = OrderedDict()
+
+        if executor == 'process':
+            self._executor = ProcessPoolExecutor(
+                max_workers=pool_size,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_initialize,
+                initargs=(config,))
+        else:
+            self.canvas = Canvas(config)
+
+        if executor == 'thread':
+            self._executor = ThreadPoolExecutor(
+                max_workers=pool_size, thread_name_prefix='render')
+
+    def __str__(self) -> str:
+        lookups = self.hits + self.misses
+        return (f'{len(self._cache)} drawings ({self.cache_size} bytes) cached, '
+                f'{self.hits} hits, {self.misses} misses '
+                f'({self.hits / max(lookups, 1):.2%} hit rate)')
+
+    def _render(self, drawing: Drawing) -> bytes:
+        return self.canvas.render(drawing).encode()
+
+    async def render(self, drawing: Drawing) -> bytes:
+        if drawing.key is None or not self.cache_bytes:
+            return await self._submit(drawing)
+
+        try:
+            data = self._cache[drawing.key]
+            self._cache.move_to_end(drawing.key)
+            self.hits += 1
+            return data
+        except KeyError:
+            self.misses += 1
+
+        data = await self._submit(drawing)
+        if drawing.key not in self._cache and len(data) <= self.cache_bytes:
+            self._cache[drawing.key] = data
+            self.cache_size += len(data)
+
+            while self.cache_size > self.cache_bytes:
+                self.cache_size -= len(self._cache.popitem(last=False)[1])
+
+        return data
+
+    async def _submit(self, drawing: Drawing) -> bytes:
+        if self._executor is None:
+            return self._render(drawing)
+
+        fn = self._render if self.canvas is not None else _render
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, drawing)
+
+    async def file(self, drawing: Drawing) -> File:
+        return File(BytesIO(await self.render(drawing)), f'{uuid.uuid4()}.{self.format}')
+
+    async def message(self, drawing: Drawing, content: Optional[str] = None) -> dict:
+        return {'content': content, 'file': await self.file(drawing)}
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
@@ -0,0 +1,9 @@
+from typing import Optional, Protocol
+
+from Wordle.Canvas import Drawing
+
+
+class Renderer(Protocol):
+    async def message(self, drawing: Drawing, content: Optional[str] = None) -> dict:
+        """ Keyword arguments for Context.send showing the drawing with the content """
+        ...
@@ -0,0 +1,103 @@
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from Wordle.CandidateSet import CandidateSet
+from Wordle.Feedback import Feedback
+
+History = Tuple[Tuple[str, int], ...]
+
+
+class Solver:
+    """
+    Tracks which words of one length bucket are consistent with a game's
+    (guess, pattern code) history, and suggests the guess with the highest
+    expected information (entropy over feedback patterns) against them.
+    """
+
+    def __init__(self, words: Sequence[str], latency_budget: float = 0.25, sample_size: int = 2000):
+        self.words: List[str] = list(words)
+        self.encoded: np.ndarray = Feedback.encode(self.words)
+        self.latency_budget: float = latency_budget
+        self.sample_size: int = sample_size
+
+        self._opener: Optional[str] = None
+
+    def candidates(self, history: History = (), current: Optional[CandidateSet] = None) -> CandidateSet:
+        """ Returns current if it matches this bucket, else rebuilds it from history """
+        if current is not None and current.size == len(self.words):
+            return current
+
+        candidates = CandidateSet(len(self.words))
+        for guess, code in history:
+            candidates = self.narrow(candidates, guess, code)
+
+        return candidates
+
+    def narrow(self, candidates: CandidateSet, guess: str, code: int) -> CandidateSet:
+        mask = candidates.mask()
+        indices = np.flatnonzero(mask)
+
+        mask[indices[Feedback.patterns(guess, self.encoded[indices]) != code]] = False
+        return CandidateSet.from_mask(mask)
+
+    def entropy(self, guesses: np.ndarray, answers: np.ndarray) -> np.ndarray:
+        matrix = Feedback.matrix(guesses, answers)
+        scores = np.empty(len(guesses))
+
+        for i, row in enumerate(matrix):
+            counts = np.unique(row, return_counts=True)[1]
+            p = counts / len(row)
+            scores[i] = -(p * np.log2(p)).sum()
+
+        return scores
+
+    def suggest(self, candidates: Optional[CandidateSet] = None) -> Optional[str]:
+        opening = candidates is None or len(candidates) == len(self.words)
+        if opening and self._opener:
+            return self._opener
+
+        candidates = np.arange(len(self.words)) if candidates is None else \
+            candidates.indices().astype(np.int64)
+        if len(candidates) <= 2:
+            return self.words[candidates[0]] if len(candidates) else None
+
+        deadline = time.monotonic() + self.latency_budget
+
+        answers = candidates
+        if len(answers) > self.sample_size:
+            answers = np.random.choice(answers, self.sample_size, replace=False)
+
+        # Score candidates first since they can also win outright, then any
+        # other word that might split the remaining answers better
+        pool = np.concatenate([
+            np.random.permutation(candidates),
+            np.random.permutation(np.setdiff1d(np.arange(len(self.words)), candidates))])
+
+        # No guess can do better than telling every answer apart
+        perfect = np.log2(len(answers)) - 1e-9
+
+        best, best_score = candidates[0], -1.0
+        complete = len(answers) == len(candidates)
+        for start in range(0, len(pool), Feedback.CHUNK_SIZE):
+            chunk = pool[start:start + Feedback.CHUNK_SIZE]
+            scores = self.entropy(self.encoded[chunk], self.encoded[answers])
+
+            i = int(scores.argmax())
+            if scores[i] > best_score:
+                best, best_score = chunk[i], scores[i]
+
+            if best_score >= perfect:
+                break
+            if time.monotonic() > deadline:
+                complete = False
+                break
+
+        # An opener from a sample or a search cut short is only a guess at
+        # the best one, so it is searched for again next time
+        suggestion = self.words[best]
+        if opening and complete:
+            self._opener = suggestion
+
+        return suggestion
@@ -1,21 +1,153 @@
+import asyncio
+import copy
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from typing import Callable, List, Optional, Tuple, Union
 
 from Wordle.Game import Game
 from Wordle.Lock import LockNotFoundError
-from Wordle.Store.InMemory import InMemoryLock
+from Wordle.Store.InMemory import InMemoryLock, Journal
 from Wordle.Store.Store import (
-    GameNotAddedError, StoreType, GameNotFoundError, GameNotUpdatedError)
+    GameNotAddedError, StoreType, GameNotFoundError, GameNotUpdatedError,
+    GameConflictError)
 
 
 class InMemoryStore():
-    def __init__(self):
+    """
+    Games idle for longer than ttl seconds are dropped by sweep(), and the
+    least recently used games are evicted beyond max_games. Every game is
+    touched on access, so the recency order is also the expiry order and a
+    sweep stops at the first live game.
+
+    With a journal, every add, write and removal is logged so recover() can
+    restore the games after a restart. Recovered games are kept encoded
+    until they are first read, so recovery time does not depend on how long
+    games take to decode.
+    """
+
+    def __init__(self,
+                 ttl: Optional[float] = None,
+                 max_games: Optional[int] = None,
+                 journal: Optional[Journal] = None):
         self.games: dict = {}
         self.store_type: StoreType = StoreType.EPHEMERAL
 
+        self.ttl: Optional[float] = ttl
+        self.max_games: Optional[int] = max_games
+        self.expired: int = 0
+        self.evicted: int = 0
+
+        # Called with the server and channel of every game dropped by expiry
+        # or eviction, rather than removed by a player
+        self.on_drop: Optional[Callable[[int, int], None]] = None
+
+        self.journal: Optional[Journal] = journal
+        self._touched: OrderedDict[Tuple[int, int], float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._touched)
+
+    def __str__(self) -> str:
+        return f'{len(self)} games, {self.expired} expired, {self.evicted} evicted'
+
     @property
     def type_desc(self) -> str:
         return self.store_type.value
 
+    def _touch(self, server_id: int, channel_id: int):
+        self._touched[server_id, channel_id] = time.monotonic()
+        self._touched.move_to_end((server_id, channel_id))
+
+    def _pop(self, server_id: int, channel_id: int) -> bool:
+        self._touched.pop((server_id, channel_id), None)
+
+        channels = self.games.get(server_id, {})
+        if channels.pop(channel_id, None) is None:
+            return False
+
+        if not channels:
+            self.games.pop(server_id)
+        if self.journal is not None:
+            self.journal.remove(server_id, channel_id)
+        return True
+
+    def _drop(self, server_id: int, channel_id: int):
+        self._pop(server_id, channel_id)
+        if self.on_drop is not None:
+            self.on_drop(server_id, channel_id)
+
+    def _evict(self):
+        while self.max_games and len(self._touched) > self.max_games:
+            server_id, channel_id = next(iter(self._touched))
+            self._drop(server_id, channel_id)
+            self.evicted += 1
+
+    def sweep(self, limit: Optional[int] = None) -> int:
+        """ Drops up to limit games idle for longer than the ttl, returning the count """
+        if not self.ttl:
+            return 0
+
+        deadline = time.monotonic() - self.ttl
+        count = 0
+        while self._touched and count != limit:
+            (server_id, channel_id), touched = next(iter(self._touched.items()))
+            if touched > deadline:
+                break
+
+            self._drop(server_id, channel_id)
+            count += 1
+
+        self.expired += count
+        return count
+
+    def _game(self, entry: dict) -> Game:
+        if isinstance(entry['game'], bytes):
+            entry['game'] = self.journal.codec.decode(entry['game'])
+            entry['game'].version = entry['version']
+
+        return entry['game']
+
+    def stored_game(self, server_id: int, channel_id: int) -> Optional[Game]:
+        """ The stored game itself rather than a copy, which must not be changed """
+        entry = self.games.get(server_id, {}).get(channel_id)
+        return self._game(entry) if entry is not None else None
+
+    def items(self) -> List[Tuple[int, int, int, Union[Game, bytes]]]:
+        """ Server, channel, version and the game, or its encoding if it has not been read since recovery """
+        return [(server_id, channel_id, entry['version'], entry['game'])
+                for server_id, channels in self.games.items()
+                for channel_id, entry in channels.items()]
+
+    async def recover(self) -> int:
+        """ Restores every game left in the journal, returning the count """
+        games = self.journal.recover()
+        now = time.monotonic()
+        for server_id, channel_id, version, payload in games:
+            self.games[server_id] = self.games.get(server_id, {})
+            self.games[server_id][channel_id] = {
+                'game': payload,
+                'lock': InMemoryLock(),
+                'version': version
+            }
+            self._touched[server_id, channel_id] = now
+            self._touched.move_to_end((server_id, channel_id))
+
+        self._evict()
+        return len(games)
+
+    def clear(self):
+        """ Forgets every game, without journaling or reporting them as dropped """
+        self.games.clear()
+        self._touched.clear()
+
+    async def run(self, interval: float = 60.0, batch_size: int = 1000):
+        """ Sweeps every interval seconds until cancelled, yielding between batches """
+        while True:
+            await asyncio.sleep(interval)
+            while self.sweep(batch_size) == batch_size:
+                await asyncio.sleep(0)
+
     @asynccontextmanager
     async def lock(self, server_id: int, channel_id: int) -> InMemoryLock:
         if not self.games.get(server_id, {}).get(channel_id, {}).get('lock'):
@@ -29,6 +161,32 @@ class InMemoryStore():
             raise GameNotUpdatedError('Game not found')
 
         self.games[server_id][channel_id]['game'] = game
+        self.games[server_id][channel_id]['version'] += 1
+        game.version = self.games[server_id][channel_id]['version']
+        self._touch(server_id, channel_id)
+        if self.journal is not None:
+            self.journal.put(server_id, channel_id, game)
+        return game
+
+    async def commit_game(self, server_id: int, channel_id: int, game: Game, finish: bool = False) -> Game:
+        """ raises GameNotFoundError, GameConflictError """
+        entry = self.games.get(server_id, {}).get(channel_id, {})
+        if not entry.get('game'):
+            raise GameNotFoundError()
+
+        if entry['version'] != game.version:
+            raise GameConflictError()
+
+        if finish:
+            self._pop(server_id, channel_id)
+            return game
+
+        entry['game'] = game
+        entry['version'] += 1
+        game.version = entry['version']
+        self._touch(server_id, channel_id)
+        if self.journal is not None:
+            self.journal.put(server_id, channel_id, game)
         return game
 
     async def add_game(self, server_id: int, channel_id: int, game: Game) -> Game:
@@ -38,20 +196,41 @@ class InMemoryStore():
         self.games[server_id] = self.games.get(server_id, {})
         self.games[server_id][channel_id] = {
             'game': game,
-            'lock': InMemoryLock()
+            'lock': InMemoryLock(),
+            'version': 0
+        }
+        game.version = 0
+        self._touch(server_id, channel_id)
+        if self.journal is not None:
+            self.journal.put(server_id, channel_id, game)
+        self._evict()
+
+        return game
+
+    async def restore_game(self, server_id: int, channel_id: int, game: Game) -> Game:
+        """ Adds or replaces a game, keeping the version it was saved at """
+        self.games[server_id] = self.games.get(server_id, {})
+        self.games[server_id][channel_id] = {
+            'game': game,
+            'lock': InMemoryLock(),
+            'version': game.version
         }
+        self._touch(server_id, channel_id)
+        self._evict()
 
         return game
 
     async def remove_game(self, server_id: int, channel_id: int) -> bool:
-        try:
-            self.games[server_id].pop(channel_id)
-            return True
-        except KeyError:
-            return False
+        return self._pop(server_id, channel_id)
 
     async def get_game(self, server_id: int, channel_id: int) -> Game:
         if not self.games.get(server_id, {}).get(channel_id, {}).get('game'):
             raise GameNotFoundError()
 
-        return self.games[server_id][channel_id]['game']
+        # Readers get their own copy so a guess in progress is invisible to
+        # others until it is committed, as it would be in Redis
+        entry = self.games[server_id][channel_id]
+        game = copy.copy(self._game(entry))
+        game.version = entry['version']
+        self._touch(server_id, channel_id)
+        return game
@@ -0,0 +1,223 @@
+import asyncio
+import glob
+import logging
+import os
+import struct
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from Wordle.Game import Game
+from Wordle.Store.Redis.GameCodec import CompactCodec, GameCodec
+
+
+class Journal:
+    """
+    Append-only log of game writes and removals for an InMemoryStore, with
+    a snapshot the log is periodically compacted into.
+
+    Records are buffered in memory and written and fsynced together by
+    flush(), so at most one flush interval of writes is lost in a crash.
+    Each record is a header of crc32, operation, server id, channel id,
+    version and payload length, followed by the encoded game. Recovery
+    stops at the first torn or corrupt record.
+
+    Compaction starts a new log generation, then writes every live game to
+    a snapshot naming that generation and deletes the older logs. Recovery
+    loads the snapshot and replays every log from its generation onwards,
+    so a crash at any point of a compaction loses nothing.
+
+    A failed write puts its records back in front of the buffer and the
+    retry goes to a new log generation, leaving any torn record it wrote at
+    the end of the old one.
+    """
+
+    HEADER = struct.Struct('<IBqqQI')
+    PUT: int = 1
+    REMOVE: int = 2
+
+    def __init__(self, directory: str, codec: Optional[GameCodec] = None):
+        self.directory: str = directory
+        self.codec: GameCodec = codec or CompactCodec()
+
+        self.generation: int = 0
+        # Bytes logged since the snapshot, across every generation
+        self.size: int = 0
+        self.records: int = 0
+        self.syncs: int = 0
+
+        self._pending: bytearray = bytearray()
+        self._pending_records: int = 0
+        self._file = None
+        self._writing: asyncio.Lock = asyncio.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+
+    def __str__(self) -> str:
+        return (f'generation {self.generation}, {self.size} bytes in logs, '
+                f'{self.records} records, {self.syncs} syncs')
+
+    @property
+    def pending(self) -> int:
+        """ Records buffered but not yet written """
+        return self._pending_records
+
+    @property
+    def snapshot_path(self) -> str:
+        return os.path.join(self.directory, 'snapshot')
+
+    def log_path(self, generation: int) -> str:
+        return os.path.join(self.directory, f'journal.{generation:08d}')
+
+    def _generations(self) -> List[int]:
+        return sorted(int(path.rsplit('.', 1)[1])
+                      for path in glob.glob(os.path.join(self.directory, 'journal.*')))
+
+    def _record(self, op: int, server_id: int, channel_id: int, version: int, payload: bytes) -> bytes:
+        header = Journal.HEADER.pack(0, op, server_id, channel_id, version, len(payload))
+        crc = zlib.crc32(payload, zlib.crc32(header[4:]))
+        return struct.pack('<I', crc) + header[4:] + payload
+
+    def put(self, server_id: int, channel_id: int, game: Game):
+        self._pending += self._record(
+            Journal.PUT, server_id, channel_id, game.version, self.codec.encode(game))
+        self.records += 1
+        self._pending_records += 1
+
+    def remove(self, server_id: int, channel_id: int):
+        self._pending += self._record(Journal.REMOVE, server_id, channel_id, 0, b'')
+        self.records += 1
+        self._pending_records += 1
+
+    @staticmethod
+    def _replay(data: bytes, games: Dict[Tuple[int, int], Optional[tuple]]):
+        view = memoryview(data)
+        offset = 0
+        size = Journal.HEADER.size
+
+        while offset + size <= len(view):
+            crc, op, server_id, channel_id, version, length = Journal.HEADER.unpack_from(view, offset)
+            end = offset + size + length
+            if end > len(view) or zlib.crc32(view[offset + 4:end]) != crc:
+                return
+
+            # Payloads stay encoded, so a game rewritten many times in the
+            # log is never decoded more than once
+            games[server_id, channel_id] = (version, view[offset + size:end]) if op == Journal.PUT else None
+            offset = end
+
+    def recover(self) -> List[Tuple[int, int, int, bytes]]:
+        """
+        Server, channel, version and encoded game of every game left by the
+        snapshot and the logs after it, after which new records go to a
+        fresh log. Decoding is left to the caller.
+        """
+        games: Dict[Tuple[int, int], Optional[tuple]] = {}
+        first = 0
+
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'rb') as file:
+                data = file.read()
+            first = struct.unpack_from('<Q', data)[0]
+            Journal._replay(data[8:], games)
+
+        generations = [generation for generation in self._generations() if generation >= first]
+        size = 0
+        for generation in generations:
+            with open(self.log_path(generation), 'rb') as file:
+                data = file.read()
+            Journal._replay(data, games)
+            size += len(data)
+
+        # The replayed logs stay until the next compaction, so they count
+        # towards it
+        self._open(max(generations + [first - 1]) + 1)
+        self.size = size
+
+        return [(server_id, channel_id, entry[0], bytes(entry[1]))
+                for (server_id, channel_id), entry in games.items() if entry is not None]
+
+    def _open(self, generation: int):
+        self.close()
+        self.generation = generation
+        self._file = open(self.log_path(generation), 'ab')
+
+    def _write(self, file, data: bytes):
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+
+    async def flush(self):
+        """ Writes and fsyncs every buffered record off the event loop """
+        async with self._writing:
+            if not self._pending:
+                return
+            if self._file is None:
+                self._open(max(self._generations() + [-1]) + 1)
+
+            data, self._pending = bytes(self._pending), bytearray()
+            records, self._pending_records = self._pending_records, 0
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._write, self._file, data)
+            except OSError:
+                self._pending[:0] = data
+                self._pending_records += records
+                try:
+                    self.close()
+                except OSError:
+                    ...
+                raise
+
+            self.size += len(data)
+            self.syncs += 1
+
+    def _snapshot(self, generation: int, games: List[Tuple[int, int, int, Union[Game, bytes]]]):
+        temporary = self.snapshot_path + '.tmp'
+        with open(temporary, 'wb') as file:
+            data = bytearray(struct.pack('<Q', generation))
+            for server_id, channel_id, version, game in games:
+                payload = game if isinstance(game, bytes) else self.codec.encode(game)
+                data += self._record(Journal.PUT, server_id, channel_id, version, payload)
+            self._write(file, data)
+
+        os.replace(temporary, self.snapshot_path)
+        for older in self._generations():
+            if older < generation:
+                os.remove(self.log_path(older))
+
+    async def compact(self, games: List[Tuple[int, int, int, Union[Game, bytes]]]):
+        """
+        Replaces the logs so far with a snapshot of games, which must be
+        every live game at the time of the call, as server, channel,
+        version and either the game or its encoding. Stored games are never
+        changed in place, so they can be encoded off the event loop.
+        """
+        await self.flush()
+        async with self._writing:
+            self._open(self.generation + 1)
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._snapshot, self.generation, games)
+            self.size = 0
+
+    async def run(self,
+                  games: Callable[[], List[Tuple[int, int, int, Union[Game, bytes]]]],
+                  interval: float = 0.05,
+                  compact_bytes: int = 64 * 1024 * 1024):
+        """
+        Flushes every interval seconds and compacts once the logs outgrow
+        compact_bytes, until cancelled. Failed writes are logged and retried
+        on the next interval.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush()
+                if self.size > compact_bytes:
+                    await self.compact(games())
+            except OSError as e:
+                logging.getLogger('WordleBot.Journal').error(
+                    f'Unable to write the journal, {self.pending} records waiting: {e}')
+
+    def close(self):
+        if self._file is not None:
+            file, self._file = self._file, None
+            file.close()
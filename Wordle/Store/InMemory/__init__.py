@@ -1,2 +1,3 @@
 from .InMemoryLock import InMemoryLock
+from .Journal import Journal
 from .InMemoryStore import InMemoryStore
@@ -0,0 +1,152 @@
+import pickle
+import struct
+import zlib
+from typing import Optional, Protocol
+
+from Wordle.CandidateSet import CandidateSet
+from Wordle.Game import Game
+from Wordle.Word import Word
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+
+class GameCodecError(Exception):
+    ...
+
+
+class GameCodec(Protocol):
+    def encode(self, game: Game) -> bytes:
+        ...
+
+    def decode(self, data: bytes) -> Game:
+        ...
+
+
+class PickleCodec:
+    def encode(self, game: Game) -> bytes:
+        return pickle.dumps(game)
+
+    def decode(self, data: bytes) -> Game:
+        return pickle.loads(data)
+
+
+class CompactCodec:
+    """
+    Versioned binary encoding of just the game state: target, mode, limit,
+    guesses, letter state and candidates. Payloads written by PickleCodec
+    (every key stored before this codec existed) are still readable.
+
+    Layout: magic, version, compression, then the (optionally compressed)
+    body of length-prefixed fields.
+    """
+
+    MAGIC: bytes = b'WG'
+    VERSION: int = 1
+
+    NONE: int = 0
+    ZLIB: int = 1
+    LZ4: int = 2
+
+    COMPRESSION = {'none': NONE, 'zlib': ZLIB, 'lz4': LZ4}
+
+    HEADER = struct.Struct('<2sBB')
+    BODY = struct.Struct('<BQQIB')
+
+    def __init__(self, compression: str = 'none', min_size: int = 256):
+        if compression not in CompactCodec.COMPRESSION:
+            raise GameCodecError(f'Unsupported compression: {compression}')
+        if compression == 'lz4' and lz4 is None:
+            raise GameCodecError('lz4 compression requires the lz4 package')
+
+        self.compression: int = CompactCodec.COMPRESSION[compression]
+        self.min_size: int = min_size
+
+    @staticmethod
+    def _pack_bytes(value: bytes) -> bytes:
+        return struct.pack('<I', len(value)) + value
+
+    @staticmethod
+    def _unpack_bytes(data: memoryview, offset: int) -> tuple:
+        size, = struct.unpack_from('<I', data, offset)
+        offset += 4
+        return bytes(data[offset:offset + size]), offset + size
+
+    def encode(self, game: Game) -> bytes:
+        state = game.__getstate__()
+
+        candidates: Optional[CandidateSet] = state['candidates']
+        if candidates is None:
+            kind, size, blob = 0, 0, b''
+        else:
+            size, bits, indices = candidates.__getstate__()
+            kind, blob = (1, bits) if bits is not None else (2, indices)
+
+        body = b''.join([
+            CompactCodec.BODY.pack(
+                state['limit'], state['letters'], state['known'], size, kind),
+            *(CompactCodec._pack_bytes(value.encode()) for value in [
+                state['target'].word,
+                state['target'].definition,
+                state['mode'],
+                state['guesses']]),
+            CompactCodec._pack_bytes(blob)])
+
+        compression = self.compression if len(body) >= self.min_size else CompactCodec.NONE
+        if compression == CompactCodec.ZLIB:
+            body = zlib.compress(body)
+        elif compression == CompactCodec.LZ4:
+            body = lz4.frame.compress(body)
+
+        return CompactCodec.HEADER.pack(
+            CompactCodec.MAGIC, CompactCodec.VERSION, compression) + body
+
+    def decode(self, data: bytes) -> Game:
+        if not data.startswith(CompactCodec.MAGIC):
+            return pickle.loads(data)
+
+        _, version, compression = CompactCodec.HEADER.unpack_from(data)
+        if version != CompactCodec.VERSION:
+            raise GameCodecError(f'Unsupported game encoding version: {version}')
+
+        body = data[CompactCodec.HEADER.size:]
+        if compression == CompactCodec.ZLIB:
+            body = zlib.decompress(body)
+        elif compression == CompactCodec.LZ4:
+            if lz4 is None:
+                raise GameCodecError('lz4 compression requires the lz4 package')
+            body = lz4.frame.decompress(body)
+
+        view = memoryview(body)
+        limit, letters, known, size, kind = CompactCodec.BODY.unpack_from(view)
+
+        offset = CompactCodec.BODY.size
+        fields = []
+        for _ in range(5):
+            value, offset = CompactCodec._unpack_bytes(view, offset)
+            fields.append(value)
+
+        word, definition, mode, guesses, blob = fields
+
+        candidates = None
+        if kind:
+            candidates = CandidateSet.__new__(CandidateSet)
+            candidates.__setstate__(
+                (size, blob, None) if kind == 1 else (size, None, blob))
+
+        return Game.from_state({
+            'target': Word(word.decode(), definition.decode()),
+            'mode': mode.decode(),
+            'limit': limit,
+            'candidates': candidates,
+            'guesses': guesses.decode(),
+            'letters': letters,
+            'known': known})
+
+
+def create_codec(name: str = 'compact', compression: str = 'none') -> GameCodec:
+    if name == 'pickle':
+        return PickleCodec()
+    return CompactCodec(compression=compression)
@@ -0,0 +1,105 @@
+import copy
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from Wordle.Game import Game
+
+
+class NearCache:
+    """
+    Least recently used cache of decoded games, keyed by server and channel.
+    Entries are private copies stamped with the version they were stored
+    at, and every lookup hands out a fresh copy so callers can play on it.
+
+    The epoch counts discarded and evicted entries. A game read from Redis
+    is only stored if nothing was discarded while it was being read, so a
+    slow read can never overwrite the news that the game has been written
+    since. Nor does an entry ever go back to an older version, which two
+    commits from this store can otherwise do when their replies arrive out
+    of order.
+
+    Entries can be given the monotonic time their Redis keys expire at,
+    after which they are dropped on lookup rather than outliving the game.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries: int = max_entries
+        self.epoch: int = 0
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.invalidations: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+        self._games: OrderedDict[Tuple[int, int], Game] = OrderedDict()
+        self._expires: Dict[Tuple[int, int], float] = {}
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def __str__(self) -> str:
+        lookups = self.hits + self.misses
+        return (f'{len(self)} games, {self.hits} hits, {self.misses} misses '
+                f'({self.hits / max(lookups, 1):.2%} hit rate), '
+                f'{self.invalidations} invalidations, {self.evictions} evictions, '
+                f'{self.expirations} expirations')
+
+    @staticmethod
+    def _copy(game: Game) -> Game:
+        result = copy.copy(game)
+        result.version = game.version
+        return result
+
+    def get(self, key: Tuple[int, int]) -> Optional[Game]:
+        try:
+            game = self._games[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        if self._expires.get(key, float('inf')) <= time.monotonic():
+            self.discard(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._games.move_to_end(key)
+        return NearCache._copy(game)
+
+    def put(self, key: Tuple[int, int], game: Game, epoch: int, expires: Optional[float] = None):
+        if epoch != self.epoch:
+            return
+
+        cached = self._games.get(key)
+        if cached is not None and cached.version >= game.version:
+            return
+
+        self._games[key] = NearCache._copy(game)
+        self._games.move_to_end(key)
+        if expires is not None:
+            self._expires[key] = expires
+        else:
+            self._expires.pop(key, None)
+
+        while len(self._games) > self.max_entries:
+            self._expires.pop(self._games.popitem(last=False)[0], None)
+            self.epoch += 1
+            self.evictions += 1
+
+    def discard(self, key: Tuple[int, int]) -> bool:
+        self.epoch += 1
+        self._expires.pop(key, None)
+        return self._games.pop(key, None) is not None
+
+    def invalidate(self, key: Tuple[int, int]):
+        """ Discards a game another store has written """
+        if self.discard(key):
+            self.invalidations += 1
+
+    def clear(self):
+        self.epoch += 1
+        self._games.clear()
+        self._expires.clear()
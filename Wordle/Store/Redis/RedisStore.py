@@ -1,20 +1,78 @@
-import pickle
-
+import asyncio
+import time
+import uuid
 from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
+
+import aioredis
+from aioredis.client import Pipeline
 
 from Wordle.Game import Game
 from Wordle.Lock import Lock
-from Wordle.RedisClient import RedisClient
+from Wordle.RedisClient import RedisClient, RedisConnectionError
 from Wordle.Store import (
-    StoreType, GameNotFoundError,
+    StoreType, GameNotFoundError, GameConflictError,
     GameNotAddedError, GameNotUpdatedError)
+from Wordle.Store.Redis.GameCodec import CompactCodec, GameCodec
+from Wordle.Store.Redis.NearCache import NearCache
 
 
 class RedisStore():
-    def __init__(self, client: RedisClient):
+    # Writes the game if it still exists and, unless ARGV[1] is empty, only
+    # if its version is the one it was read at; or deletes it when ARGV[3]
+    # says the game is over. Either way ARGV[5] is published on channel
+    # ARGV[4]. Written keys expire after ARGV[6] idle seconds unless it is
+    # empty. Returns -1 when missing, 0 on a conflict and otherwise the new
+    # version.
+    COMMIT: str = """
+        if redis.call('EXISTS', KEYS[1]) == 0 then
+            return -1
+        end
+        if ARGV[1] ~= '' and (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+            return 0
+        end
+        if ARGV[3] == '1' then
+            redis.call('DEL', KEYS[1], KEYS[2])
+            redis.call('PUBLISH', ARGV[4], ARGV[5])
+            return 1
+        end
+        redis.call('PUBLISH', ARGV[4], ARGV[5])
+        if ARGV[6] == '' then
+            redis.call('SET', KEYS[1], ARGV[2])
+            return redis.call('INCR', KEYS[2])
+        end
+        redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[6])
+        local version = redis.call('INCR', KEYS[2])
+        redis.call('EXPIRE', KEYS[2], ARGV[6])
+        return version
+    """
+
+    # The game, its version and the milliseconds until the game expires,
+    # so a cached read never outlives the key it came from
+    READ: str = """
+        return {redis.call('GET', KEYS[1]), redis.call('GET', KEYS[2]), redis.call('PTTL', KEYS[1])}
+    """
+
+    def __init__(self,
+                 client: RedisClient,
+                 codec: Optional[GameCodec] = None,
+                 cache: Optional[NearCache] = None,
+                 ttl: Optional[int] = None):
+
         self.client: RedisClient = client
+        self.ttl: Optional[int] = ttl
+        self.codec: GameCodec = codec or CompactCodec()
         self.path_prefix: str = self.client.path('wordle')
         self.store_type: StoreType = StoreType.PERSISTENT
+        self._commit = self.client.register_script(RedisStore.COMMIT)
+        self._read = self.client.register_script(RedisStore.READ)
+
+        # Every write announces its server and channel here, tagged with
+        # the writing store so it can skip its own announcements
+        self.cache: Optional[NearCache] = cache
+        self.node: str = uuid.uuid4().hex
+        self.channel: str = self.client.path(self.path_prefix, 'writes')
+        self._listening: bool = False
 
     @property
     def type_desc(self) -> str:
@@ -33,15 +91,113 @@ class RedisStore():
 
             yield
 
+    def _announcement(self, server_id: int, channel_id: int) -> str:
+        return self.client.path(self.node, server_id, channel_id)
+
+    async def listen(self):
+        """
+        Keeps the near cache coherent by dropping games other stores write,
+        until cancelled. The cache is only consulted while subscribed, and
+        is emptied whenever the subscription is lost.
+        """
+        if self.cache is None:
+            return
+
+        while True:
+            try:
+                async with self.client.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+
+                    async for message in pubsub.listen():
+                        if message['type'] == 'subscribe':
+                            self._listening = True
+                        elif message['type'] == 'message':
+                            node, server_id, channel_id = message['data'].decode().split(':')
+                            if node != self.node:
+                                self.cache.invalidate((int(server_id), int(channel_id)))
+            except (aioredis.ConnectionError, RedisConnectionError):
+                pass
+            finally:
+                self._listening = False
+                self.cache.clear()
+
+            await asyncio.sleep(1)
+
+    @staticmethod
+    async def _execute(pipe: Pipeline) -> list:
+        # Pipelines bypass RedisClient.execute_command and its error mapping
+        try:
+            return await pipe.execute()
+        except aioredis.ConnectionError as e:
+            raise RedisConnectionError(e)
+
+    def _cached(self) -> Optional[NearCache]:
+        return self.cache if self._listening else None
+
     async def get_game(self, server_id: int, channel_id: int) -> Game:
-        pickled_game = await self.client.get(
-            self.path(server_id, channel_id, 'game'))
+        key: Tuple[int, int] = (server_id, channel_id)
+        cache = self._cached()
+        if cache is not None:
+            game = cache.get(key)
+            if game is not None:
+                return game
+            epoch = cache.epoch
+
+        keys = [self.path(server_id, channel_id, 'game'),
+                self.path(server_id, channel_id, 'version')]
+        expires = None
+        if cache is not None and self.ttl:
+            sent = time.monotonic()
+            encoded_game, version, pttl = await self._read(keys=keys)
+            expires = sent + pttl / 1000 if pttl >= 0 else None
+        else:
+            encoded_game, version = await self.client.mget(*keys)
 
-        if pickled_game:
-            return pickle.loads(pickled_game)
+        if encoded_game:
+            game = self.codec.decode(encoded_game)
+            game.version = int(version or 0)
+            if cache is not None:
+                cache.put(key, game, epoch, expires)
+            return game
 
         raise GameNotFoundError()
 
+    async def _commit_game(self,
+                           server_id: int,
+                           channel_id: int,
+                           game: Game,
+                           check_version: bool,
+                           finish: bool) -> Game:
+
+        key: Tuple[int, int] = (server_id, channel_id)
+        cache = self._cached()
+        epoch = cache.epoch if cache is not None else 0
+        expires = time.monotonic() + self.ttl if self.ttl else None
+
+        result = await self._commit(
+            keys=[self.path(server_id, channel_id, 'game'),
+                  self.path(server_id, channel_id, 'version')],
+            args=[game.version if check_version else '',
+                  b'' if finish else self.codec.encode(game),
+                  int(finish),
+                  self.channel,
+                  self._announcement(server_id, channel_id),
+                  self.ttl or ''])
+
+        if result in [-1, 0] or finish:
+            if cache is not None:
+                cache.discard(key)
+        if result == -1:
+            raise GameNotFoundError()
+        if result == 0:
+            raise GameConflictError()
+
+        if not finish:
+            game.version = result
+            if cache is not None:
+                cache.put(key, game, epoch, expires)
+        return game
+
     async def _set_game(self,
                         server_id: int,
                         channel_id: int,
@@ -51,29 +207,82 @@ class RedisStore():
 
         return await self.client.set(
             name=self.path(server_id, channel_id, 'game'),
-            value=pickle.dumps(game),
+            value=self.codec.encode(game),
             nx=only_if_new,
             xx=must_exist)
 
     async def update_game(self, server_id: int, channel_id: int, game: Game) -> Game:
-        if await self._set_game(
-                server_id=server_id,
-                channel_id=channel_id,
-                game=game,
-                must_exist=True):
-            return game
+        try:
+            return await self._commit_game(
+                server_id, channel_id, game, check_version=False, finish=False)
+        except GameNotFoundError:
+            raise GameNotUpdatedError()
 
-        raise GameNotUpdatedError()
+    async def commit_game(self, server_id: int, channel_id: int, game: Game, finish: bool = False) -> Game:
+        """ raises GameNotFoundError, GameConflictError """
+        return await self._commit_game(
+            server_id, channel_id, game, check_version=True, finish=finish)
 
     async def add_game(self, server_id: int, channel_id: int, game: Game) -> Game:
-        if await self._set_game(
-                server_id=server_id,
-                channel_id=channel_id,
-                game=game,
-                only_if_new=True):
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(self.path(server_id, channel_id, 'game'), self.codec.encode(game),
+                     nx=True, ex=self.ttl)
+            pipe.publish(self.channel, self._announcement(server_id, channel_id))
+            added, _ = await RedisStore._execute(pipe)
+
+        # A new game starts again from version 0
+        if added and self.cache is not None:
+            self.cache.discard((server_id, channel_id))
+        if added:
             return game
         raise GameNotAddedError()
 
     async def remove_game(self, server_id: int, channel_id: int) -> bool:
-        return await self.client.delete(
-            self.path(server_id, channel_id, 'game')) == 1
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.delete(
+                self.path(server_id, channel_id, 'game'),
+                self.path(server_id, channel_id, 'version'))
+            pipe.publish(self.channel, self._announcement(server_id, channel_id))
+            deleted, _ = await RedisStore._execute(pipe)
+
+        if self.cache is not None:
+            self.cache.discard((server_id, channel_id))
+        return deleted >= 1
+
+    async def save_games(self, games: Dict[Tuple[int, int], Optional[Game]]):
+        """ Writes every game, or deletes it when None, in one pipeline """
+        async with self.client.pipeline(transaction=False) as pipe:
+            for (server_id, channel_id), game in games.items():
+                keys = [self.path(server_id, channel_id, 'game'),
+                        self.path(server_id, channel_id, 'version')]
+
+                if game is None:
+                    pipe.delete(*keys)
+                else:
+                    pipe.set(keys[0], self.codec.encode(game), ex=self.ttl)
+                    pipe.set(keys[1], game.version, ex=self.ttl)
+
+            await RedisStore._execute(pipe)
+
+    async def load_games(self, batch_size: int = 500) -> List[Tuple[int, int, Game]]:
+        """ Every stored game with its server and channel ids and version """
+        keys = [key async for key in self.client.scan_iter(
+            match=self.path('*', '*', 'game'), count=batch_size)]
+
+        games = []
+        for i in range(0, len(keys), batch_size):
+            batch = keys[i:i + batch_size]
+            values = await self.client.mget(
+                batch + [key[:-len(b'game')] + b'version' for key in batch])
+
+            for key, encoded_game, version in zip(batch, values[:len(batch)], values[len(batch):]):
+                if not encoded_game:
+                    continue
+
+                # ...:server:<server_id>:channel:<channel_id>:game
+                parts = key.decode().split(':')
+                game = self.codec.decode(encoded_game)
+                game.version = int(version or 0)
+                games.append((int(parts[-4]), int(parts[-2]), game))
+
+        return games
@@ -1 +1,4 @@
+from .GameCodec import (GameCodec, GameCodecError, CompactCodec,
+                        PickleCodec, create_codec)
+from .NearCache import NearCache
 from .RedisStore import RedisStore
@@ -9,6 +9,7 @@ from Wordle.Lock import Lock
 class StoreType(Enum):
     EPHEMERAL = 'ephemeral'
     PERSISTENT = 'persistent'
+    WRITE_BEHIND = 'write-behind'
 
 
 class StoreError(Exception):
@@ -27,6 +28,10 @@ class GameNotFoundError(StoreError):
     ...
 
 
+class GameConflictError(GameNotUpdatedError):
+    ...
+
+
 class Store(Protocol):
     @property
     def type_desc(self) -> str:
@@ -42,6 +47,9 @@ class Store(Protocol):
     def add_game(self, server_id: int, channel_id: int, game: Game) -> Game:
         ...
 
+    def commit_game(self, server_id: int, channel_id: int, game: Game, finish: bool = False) -> Game:
+        ...
+
     def remove_game(self, server_id: int, channel_id: int) -> bool:
         ...
 
@@ -0,0 +1,138 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Set, Tuple
+
+from Wordle.Game import Game
+from Wordle.Lock import Lock
+from Wordle.RedisClient import RedisConnectionError
+from Wordle.Store.InMemory import InMemoryStore
+from Wordle.Store.Redis import RedisStore
+from Wordle.Store.Store import StoreType
+
+
+class WriteBehindStore:
+    """
+    Serves every read and write from an InMemoryStore and copies changed
+    games to a RedisStore in the background, batched into one pipeline per
+    flush. A flush happens every flush_interval seconds, or sooner once
+    flush_size games are waiting. Games written since the last flush are
+    lost if the process dies without a final flush.
+
+    Redis is only a backup here, so only the instance holding Main's bot
+    lock may rehydrate or flush. Games changed in memory without the lock
+    are never flushed, as the next rehydrate replaces them.
+    """
+
+    def __init__(self,
+                 memory: InMemoryStore,
+                 redis: RedisStore,
+                 flush_interval: float = 1.0,
+                 flush_size: int = 100):
+
+        self.memory: InMemoryStore = memory
+        self.redis: RedisStore = redis
+        self.store_type: StoreType = StoreType.WRITE_BEHIND
+
+        self.flush_interval: float = flush_interval
+        self.flush_size: int = flush_size
+        self.flushes: int = 0
+        self.flushed: int = 0
+
+        self._dirty: Set[Tuple[int, int]] = set()
+        self._full: asyncio.Event = asyncio.Event()
+        self._flushing: asyncio.Lock = asyncio.Lock()
+
+        # Games expired or evicted from memory are deleted from Redis too
+        self.memory.on_drop = self._changed
+
+    @property
+    def type_desc(self) -> str:
+        return self.store_type.value
+
+    @property
+    def pending(self) -> int:
+        return len(self._dirty)
+
+    def _changed(self, server_id: int, channel_id: int):
+        self._dirty.add((server_id, channel_id))
+        if len(self._dirty) >= self.flush_size:
+            self._full.set()
+
+    @asynccontextmanager
+    async def lock(self, server_id: int, channel_id: int) -> Lock:
+        async with self.memory.lock(server_id, channel_id):
+            yield
+
+    async def get_game(self, server_id: int, channel_id: int) -> Game:
+        return await self.memory.get_game(server_id, channel_id)
+
+    async def add_game(self, server_id: int, channel_id: int, game: Game) -> Game:
+        game = await self.memory.add_game(server_id, channel_id, game)
+        self._changed(server_id, channel_id)
+        return game
+
+    async def update_game(self, server_id: int, channel_id: int, game: Game) -> Game:
+        game = await self.memory.update_game(server_id, channel_id, game)
+        self._changed(server_id, channel_id)
+        return game
+
+    async def commit_game(self, server_id: int, channel_id: int, game: Game, finish: bool = False) -> Game:
+        """ raises GameNotFoundError, GameConflictError """
+        game = await self.memory.commit_game(server_id, channel_id, game, finish)
+        self._changed(server_id, channel_id)
+        return game
+
+    async def remove_game(self, server_id: int, channel_id: int) -> bool:
+        removed = await self.memory.remove_game(server_id, channel_id)
+        self._changed(server_id, channel_id)
+        return removed
+
+    async def rehydrate(self) -> int:
+        """ Replaces every game in memory with those saved in Redis, returning the count """
+        games = await self.redis.load_games()
+        self.memory.clear()
+        self._dirty.clear()
+        self._full.clear()
+        for server_id, channel_id, game in games:
+            await self.memory.restore_game(server_id, channel_id, game)
+
+        return len(games)
+
+    async def flush(self) -> int:
+        """
+        Saves the latest state of every game changed since the last flush,
+        or deletes it from Redis if it has since ended. Games stay dirty if
+        the flush fails.
+        """
+        async with self._flushing:
+            dirty, self._dirty = self._dirty, set()
+            self._full.clear()
+            if not dirty:
+                return 0
+
+            games: Dict[Tuple[int, int], Optional[Game]] = {}
+            for server_id, channel_id in dirty:
+                games[server_id, channel_id] = self.memory.stored_game(server_id, channel_id)
+
+            try:
+                await self.redis.save_games(games)
+            except BaseException:
+                self._dirty |= dirty
+                raise
+
+            self.flushes += 1
+            self.flushed += len(games)
+            return len(games)
+
+    async def run(self):
+        """ Flushes on the interval or when enough games are waiting, until cancelled """
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                await self.flush()
+            except RedisConnectionError:
+                await asyncio.sleep(self.flush_interval)
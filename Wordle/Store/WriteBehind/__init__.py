@@ -0,0 +1 @@
+from .WriteBehindStore import WriteBehindStore
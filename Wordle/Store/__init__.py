@@ -1,4 +1,5 @@
 from .Store import (Store, StoreType, GameNotFoundError,
-                    GameNotAddedError, GameNotUpdatedError)
+                    GameNotAddedError, GameNotUpdatedError, GameConflictError)
 from .InMemory import InMemoryLock, InMemoryStore
 from .Redis import RedisStore
+from .WriteBehind import WriteBehindStore
@@ -0,0 +1,37 @@
+from typing import Dict, Optional
+
+from Wordle.Canvas import Drawing
+from Wordle.Canvas.Drawing import Row
+from Wordle.Canvas.Glyph import GlyphColor
+
+
+class TextRenderer:
+    """
+    Renders drawings as rows of emoji squares followed by their letters,
+    so a message costs no drawing, encoding or file upload.
+    """
+
+    SQUARES: Dict[GlyphColor, str] = {
+        GlyphColor.GREEN: '\N{LARGE GREEN SQUARE}',
+        GlyphColor.YELLOW: '\N{LARGE YELLOW SQUARE}',
+        GlyphColor.RED: '\N{LARGE RED SQUARE}',
+        GlyphColor.CLEAR: '',
+        GlyphColor.DARK_GRAY: '\N{BLACK LARGE SQUARE}',
+        GlyphColor.INVERSE_DARK_GRAY: '\N{BLACK LARGE SQUARE}',
+        GlyphColor.GRAY: '\N{BLACK LARGE SQUARE}',
+        GlyphColor.INVERSE_GRAY: '\N{BLACK LARGE SQUARE}',
+        GlyphColor.LIGHT_GRAY: '\N{WHITE LARGE SQUARE}',
+        GlyphColor.INVERSE_LIGHT_GRAY: '\N{BLACK LARGE SQUARE}'}
+
+    def render_row(self, row: Row) -> str:
+        cells = [(char, color) for char, color in row if color != GlyphColor.CLEAR]
+        squares = ''.join(TextRenderer.SQUARES[color] for _, color in cells)
+        letters = ''.join(char if char.strip() else '_' for char, _ in cells)
+        return f'{squares} `{letters}`'
+
+    def render(self, drawing: Drawing) -> str:
+        return '\n'.join(self.render_row(row) for row in drawing.rows)
+
+    async def message(self, drawing: Drawing, content: Optional[str] = None) -> dict:
+        text = self.render(drawing)
+        return {'content': f'{content}\n{text}' if content else text}
@@ -0,0 +1,59 @@
+import sqlite3
+import threading
+from os.path import abspath
+from typing import List, Optional
+from urllib.request import pathname2url
+
+from Wordle.Word import Word
+from Wordle.WordIndex import WordIndex
+
+
+class WordDatabase:
+    """ Queries wordle.db directly, with one read-only connection per thread """
+
+    def __init__(self, path: str):
+        self.uri: str = f'file:{pathname2url(abspath(path))}?mode=ro'
+        self._local = threading.local()
+        self._length: Optional[str] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        con = getattr(self._local, 'connection', None)
+        if con is None:
+            con = sqlite3.connect(self.uri, uri=True)
+            self._local.connection = con
+        return con
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        return self._connection().execute(sql, params).fetchall()
+
+    @property
+    def length(self) -> str:
+        """ The indexed length column, or LENGTH(word) in databases seeded before it existed """
+        if self._length is None:
+            columns = [row[1] for row in self._query('PRAGMA table_info(words)')]
+            self._length = 'length' if 'length' in columns else 'LENGTH(word)'
+        return self._length
+
+    def __len__(self) -> int:
+        return self._query('SELECT COUNT(DISTINCT word) FROM words')[0][0]
+
+    def __contains__(self, word: str) -> bool:
+        return bool(self._query('SELECT 1 FROM words WHERE word=? LIMIT 1', (word,)))
+
+    def lengths(self) -> List[int]:
+        return [row[0] for row in self._query(
+            f'SELECT DISTINCT {self.length} FROM words ORDER BY 1')]
+
+    def words(self, word_length: int) -> List[str]:
+        return [row[0] for row in self._query(
+            f'SELECT DISTINCT word FROM words WHERE {self.length}=? ORDER BY word', (word_length,))]
+
+    def get_by_word(self, word: str) -> List[Word]:
+        return [WordIndex.hydrate(row[0], row[1]) for row in self._query(
+            'SELECT word, definition FROM words WHERE word=?', (word.lower(),))]
+
+    def get_random(self, word_length: int = 5, count: int = 1) -> List[Word]:
+        return [WordIndex.hydrate(row[0], row[1]) for row in self._query(
+            'SELECT word, definition FROM words '
+            f'WHERE {self.length}=? ORDER BY RANDOM() LIMIT ?',
+            (word_length, count))]
@@ -0,0 +1,172 @@
+import mmap
+import os
+import random
+import struct
+import sys
+import time
+from typing import Dict, List, NamedTuple
+
+from Wordle.Word import Word
+from Wordle.WordIndex import WordIndex
+
+
+class WordFileError(Exception):
+    ...
+
+
+class Partition(NamedTuple):
+    length: int
+    width: int
+    count: int
+    words_offset: int
+    definitions_offset: int
+
+
+class WordFile:
+    """
+    Read-only, memory-mapped dictionary compiled from wordle.db.
+
+    Layout (little-endian):
+        header      magic, version, partition count
+        partitions  one entry per word length
+        words       per partition: sorted, NUL-padded, fixed-width words
+        index       per partition: (offset, size) of each word's definitions
+        definitions newline-joined definitions, only read on demand
+    """
+
+    MAGIC: bytes = b'WRDL'
+    VERSION: int = 1
+
+    HEADER = struct.Struct('<4sHH')
+    PARTITION = struct.Struct('<HHIQQ')
+    DEFINITION = struct.Struct('<QI')
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, partitions = WordFile.HEADER.unpack_from(self._buffer)
+        if magic != WordFile.MAGIC or version != WordFile.VERSION:
+            raise WordFileError(f'{path} is not a version {WordFile.VERSION} word file')
+
+        self._partitions: Dict[int, Partition] = {}
+        for i in range(partitions):
+            partition = Partition(*WordFile.PARTITION.unpack_from(
+                self._buffer, WordFile.HEADER.size + i * WordFile.PARTITION.size))
+            self._partitions[partition.length] = partition
+
+    @staticmethod
+    def compile(database: str, path: str) -> int:
+        """ Writes the word file for a seeded database, returns the word count """
+        index = WordIndex.from_database(database)
+        buckets = [(length, sorted(word.encode() for word in index.words(length)))
+                   for length in index.lengths()]
+
+        words_offset = WordFile.HEADER.size + len(buckets) * WordFile.PARTITION.size
+        definitions_offset = words_offset + sum(
+            len(bucket) * max(map(len, bucket)) for _, bucket in buckets)
+        blob_offset = definitions_offset + sum(
+            len(bucket) * WordFile.DEFINITION.size for _, bucket in buckets)
+
+        table, words, entries, definitions = [], [], [], []
+
+        for length, bucket in buckets:
+            width = max(map(len, bucket))
+            table.append(Partition(
+                length, width, len(bucket), words_offset, definitions_offset))
+
+            words.append(b''.join(word.ljust(width, b'\0') for word in bucket))
+            words_offset += len(bucket) * width
+            definitions_offset += len(bucket) * WordFile.DEFINITION.size
+
+            for word in bucket:
+                blob = '\n'.join(
+                    w.definition for w in index.get_by_word(word.decode())).encode()
+                entries.append(WordFile.DEFINITION.pack(blob_offset, len(blob)))
+                definitions.append(blob)
+                blob_offset += len(blob)
+
+        staging = f'{path}.{os.getpid()}.tmp'
+        with open(staging, 'wb') as f:
+            f.write(WordFile.HEADER.pack(WordFile.MAGIC, WordFile.VERSION, len(table)))
+            f.writelines(WordFile.PARTITION.pack(*entry) for entry in table)
+            f.writelines(words)
+            f.writelines(entries)
+            f.writelines(definitions)
+
+        os.replace(staging, path)
+        return len(index)
+
+    def __len__(self) -> int:
+        return sum(p.count for p in self._partitions.values())
+
+    def __contains__(self, word: str) -> bool:
+        return self._find(word) is not None
+
+    def _find(self, word: str):
+        partition = self._partitions.get(len(word))
+        if not partition:
+            return None
+
+        key = word.encode()
+        if len(key) > partition.width:
+            return None
+        key = key.ljust(partition.width, b'\0')
+
+        lo, hi = 0, partition.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = partition.words_offset + mid * partition.width
+            candidate = self._buffer[start:start + partition.width]
+
+            if candidate == key:
+                return partition, mid
+            if candidate < key:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return None
+
+    def _word(self, partition: Partition, i: int) -> str:
+        start = partition.words_offset + i * partition.width
+        return self._buffer[start:start + partition.width].rstrip(b'\0').decode()
+
+    def _definitions(self, partition: Partition, i: int) -> List[str]:
+        offset, size = WordFile.DEFINITION.unpack_from(
+            self._buffer, partition.definitions_offset + i * WordFile.DEFINITION.size)
+
+        return self._buffer[offset:offset + size].decode().split('\n')
+
+    def lengths(self) -> List[int]:
+        return sorted(self._partitions)
+
+    def words(self, word_length: int) -> List[str]:
+        partition = self._partitions.get(word_length)
+        if not partition:
+            return []
+
+        return [self._word(partition, i) for i in range(partition.count)]
+
+    def get_by_word(self, word: str) -> List[Word]:
+        word = word.lower()
+        found = self._find(word)
+        if not found:
+            return []
+
+        return [Word(word, definition) for definition in self._definitions(*found)]
+
+    def get_random(self, word_length: int = 5, count: int = 1) -> List[Word]:
+        partition = self._partitions.get(word_length)
+        if not partition:
+            return []
+
+        return [Word(self._word(partition, i), random.choice(self._definitions(partition, i)))
+                for i in random.sample(range(partition.count), min(count, partition.count))]
+
+
+if __name__ == '__main__':
+    # Usage: python -m Wordle.WordFile <database> <path>
+    started = time.perf_counter()
+    count = WordFile.compile(*sys.argv[1:3])
+    print(f'Compiled {count} words in {time.perf_counter() - started:.2f}s')
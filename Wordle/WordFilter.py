@@ -0,0 +1,118 @@
+import hashlib
+import math
+import os
+import struct
+import sys
+import time
+from typing import Iterable, Optional
+
+from Wordle.WordSource import WordSource
+
+
+class WordFilterError(Exception):
+    ...
+
+
+class WordFilter:
+    """
+    Bloom filter over the dictionary. A negative answer is definitive, so
+    junk guesses are rejected without touching the word source.
+    """
+
+    MAGIC: bytes = b'WBLM'
+    VERSION: int = 1
+
+    HEADER = struct.Struct('<4sHHQQ')
+
+    def __init__(self, size: int, hashes: int, count: int = 0, bits: Optional[bytearray] = None):
+        self.size: int = size
+        self.hashes: int = hashes
+        self.count: int = count
+        self.bits: bytearray = bits if bits is not None else bytearray((size + 7) // 8)
+
+        self.checks: int = 0
+        self.rejected: int = 0
+        self.false_positives: int = 0
+
+    def __str__(self) -> str:
+        return (f'{self.checks} checks, {self.rejected} lookups saved, '
+                f'{self.false_positives} false positives '
+                f'({self.false_positive_rate:.2%})')
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float) -> 'WordFilter':
+        capacity = max(capacity, 1)
+        size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        hashes = max(1, round(size / capacity * math.log(2)))
+        return cls(size=size, hashes=hashes)
+
+    @classmethod
+    def from_words(cls, words: Iterable[str], capacity: int, error_rate: float) -> 'WordFilter':
+        bloom = cls.for_capacity(capacity, error_rate)
+        for word in words:
+            bloom.add(word)
+        return bloom
+
+    @classmethod
+    def from_source(cls, source: WordSource, error_rate: float) -> 'WordFilter':
+        return cls.from_words(
+            (word for length in source.lengths() for word in source.words(length)),
+            capacity=len(source),
+            error_rate=error_rate)
+
+    @classmethod
+    def load(cls, path: str) -> 'WordFilter':
+        with open(path, 'rb') as f:
+            magic, version, hashes, size, count = WordFilter.HEADER.unpack(
+                f.read(WordFilter.HEADER.size))
+            if magic != WordFilter.MAGIC or version != WordFilter.VERSION:
+                raise WordFilterError(
+                    f'{path} is not a version {WordFilter.VERSION} word filter')
+
+            return cls(size=size, hashes=hashes, count=count, bits=bytearray(f.read()))
+
+    def save(self, path: str):
+        staging = f'{path}.{os.getpid()}.tmp'
+        with open(staging, 'wb') as f:
+            f.write(WordFilter.HEADER.pack(
+                WordFilter.MAGIC, WordFilter.VERSION, self.hashes, self.size, self.count))
+            f.write(self.bits)
+
+        os.replace(staging, path)
+
+    @property
+    def false_positive_rate(self) -> float:
+        """ Share of non-words that got past the filter """
+        misses = self.rejected + self.false_positives
+        return self.false_positives / misses if misses else 0.0
+
+    def _positions(self, word: str) -> Iterable[int]:
+        digest = hashlib.blake2b(word.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, word: str):
+        for pos in self._positions(word):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def might_contain(self, word: str) -> bool:
+        self.checks += 1
+        if all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(word)):
+            return True
+
+        self.rejected += 1
+        return False
+
+
+if __name__ == '__main__':
+    # Usage: python -m Wordle.WordFilter <path> [error_rate]
+    from Wordle.Words import Words
+
+    started = time.perf_counter()
+    bloom = WordFilter.from_source(
+        Words.load(), error_rate=float(sys.argv[2]) if len(sys.argv) > 2 else 0.01)
+    bloom.save(sys.argv[1])
+    print(f'Built filter for {bloom.count} words ({len(bloom.bits)} bytes) '
+          f'in {time.perf_counter() - started:.2f}s')
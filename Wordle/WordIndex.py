@@ -0,0 +1,55 @@
+import random
+import sqlite3
+from contextlib import closing
+from typing import Dict, Iterable, List
+
+from Wordle.Word import Word
+
+
+class WordIndex:
+    """ In-memory dictionary, bucketed by word length """
+
+    def __init__(self, words: Iterable[Word]):
+        self._by_word: Dict[str, List[Word]] = {}
+
+        for word in words:
+            self._by_word.setdefault(word.word, []).append(word)
+
+        buckets: Dict[int, List[str]] = {}
+        for word in self._by_word:
+            buckets.setdefault(len(word), []).append(word)
+
+        self._by_length: Dict[int, List[str]] = {
+            length: sorted(bucket) for length, bucket in buckets.items()}
+
+    @classmethod
+    def from_database(cls, path: str) -> 'WordIndex':
+        con = sqlite3.connect(path)
+        with closing(con), closing(con.cursor()) as cur:
+            cur.execute('SELECT word, definition FROM words')
+            return cls(WordIndex.hydrate(row[0], row[1]) for row in cur)
+
+    @staticmethod
+    def hydrate(word: str, definition: str) -> Word:
+        return Word(word.lower(), definition.replace('\n', '').strip())
+
+    def __len__(self) -> int:
+        return len(self._by_word)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._by_word
+
+    def lengths(self) -> List[int]:
+        return sorted(self._by_length)
+
+    def words(self, word_length: int) -> List[str]:
+        return self._by_length.get(word_length, [])
+
+    def get_by_word(self, word: str) -> List[Word]:
+        return list(self._by_word.get(word.lower(), []))
+
+    def get_random(self, word_length: int = 5, count: int = 1) -> List[Word]:
+        bucket = self._by_length.get(word_length, [])
+        words = random.sample(bucket, min(count, len(bucket)))
+
+        return [random.choice(self._by_word[word]) for word in words]
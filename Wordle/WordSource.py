@@ -0,0 +1,23 @@
+from typing import List, Protocol
+
+from Wordle.Word import Word
+
+
+class WordSource(Protocol):
+    def __len__(self) -> int:
+        ...
+
+    def __contains__(self, word: str) -> bool:
+        ...
+
+    def lengths(self) -> List[int]:
+        ...
+
+    def words(self, word_length: int) -> List[str]:
+        ...
+
+    def get_by_word(self, word: str) -> List[Word]:
+        ...
+
+    def get_random(self, word_length: int = 5, count: int = 1) -> List[Word]:
+        ...
@@ -1,6 +1,7 @@
 import logging
 from typing import Optional
 
+from discord import TextChannel
 from discord.ext import commands
 from discord.ext.commands import Context, Bot, CommandError
 
@@ -12,18 +13,35 @@ from .Game import Game
 from .GameManager import GameManager
 from .Lock import LockNotFoundError
 from .RedisClient import RedisConnectionError
+from .RenderService import RenderService
+from .Renderer import Renderer
 from .Store import GameNotFoundError, Store
-from .Words import Words
+from .TextRenderer import TextRenderer
+from .WordsService import WordsService
 
 
 class Wordle(commands.Cog):
-    def __init__(self, bot: Bot, config: Config, state_backend: Store, logger: logging.Logger):
+    def __init__(self, bot: Bot, config: Config, state_backend: Store, words: WordsService,
+                 renders: RenderService, logger: logging.Logger):
         self.bot = bot
+        self.words: WordsService = words
+        self.renders: RenderService = renders
+        self.text: TextRenderer = TextRenderer()
+        self.config: Config = config
         self.games: GameManager = GameManager(
-            canvas_config=config.canvas,
-            backend=state_backend)
+            backend=state_backend,
+            words=words,
+            retries=config.guess_retries)
         self.logger: logging.Logger = logger.getChild(self.__class__.__name__)
 
+    def renderer(self, channel: TextChannel) -> Renderer:
+        if channel.id in self.config.text_channels:
+            return self.text
+        if channel.id in self.config.image_channels:
+            return self.renders
+
+        return self.text if self.config.output == 'text' else self.renders
+
     async def cog_command_error(self, ctx: Context, error: CommandError):
         err = getattr(error, 'original', error)
 
@@ -53,7 +71,7 @@ class Wordle(commands.Cog):
         if word_length < 2 or word_length > 20:
             return await ctx.send('Unfortunately I only support words with between 2 and 20 letters.')
 
-        game = self.games.create_game(word_length=word_length, mode=mode)
+        game = await self.games.create_game(word_length=word_length, mode=mode)
 
         self.logger.debug(f'New game started: {game.target.word}')
 
@@ -63,10 +81,10 @@ class Wordle(commands.Cog):
         await self.games.add_game(ctx.message.channel, game)
 
         if game.mode == Game.PUZZLE:
-            await ctx.send(
-                f'Alright, {RandomText.smarty()}...can you solve my puzzle?',
-                file=game.progress.to_discord_file()
-            )
+            await ctx.send(**await self.renderer(ctx.message.channel).message(
+                game.progress,
+                f'Alright, {RandomText.smarty()}...can you solve my puzzle?'
+            ))
         elif game.mode == Game.LIMITED:
             await ctx.send(
                 f'Game started. I\'m think of a word that is {word_length} letters long. '
@@ -93,26 +111,22 @@ class Wordle(commands.Cog):
 
     @commands.command(aliases=['g'])
     async def guess(self, ctx: Context, word: Optional[str] = None):
-        async with self.games.lock(ctx.message.channel):
-            game = await self.games.get_current_game(ctx.message.channel)
-
-            status, message, image = game.guess(word, author_id=ctx.author.id)
-            await self.games.update_game(ctx.message.channel, game)
+        status, message, image = await self.games.guess(
+            ctx.message.channel, word, author_id=ctx.author.id)
 
-            if status in [Game.CORRECT, Game.FAILED]:
-                await self.games.stop_current_game(ctx.message.channel)
+        renderer = self.renderer(ctx.message.channel)
 
-            if status == Game.FAILED:
-                await ctx.send(file=image.to_discord_file())
+        if status == Game.FAILED:
+            await ctx.send(**await renderer.message(image))
 
-            if status in [Game.INCORRECT, Game.CORRECT] and image:
-                return await ctx.send(message, file=image.to_discord_file())
+        if status in [Game.INCORRECT, Game.CORRECT] and image:
+            return await ctx.send(**await renderer.message(image, message))
 
-            return await ctx.send(message)
+        return await ctx.send(message)
 
     @commands.command(aliases=['d'])
     async def define(self, ctx: Context, word: str):
-        words = Words.get_by_word(word)
+        words = await self.words.get_by_word(word)
 
         if not words:
             return await ctx.send('I don\'t know what that word means, sorry!')
@@ -125,30 +139,39 @@ class Wordle(commands.Cog):
 
     @commands.command(aliases=['p'])
     async def progress(self, ctx: Context):
-        async with self.games.lock(ctx.message.channel):
-            game = await self.games.get_current_game(ctx.message.channel)
+        game = await self.games.get_current_game(ctx.message.channel)
 
-            if not game.guesses:
-                return await ctx.send(
-                    'There have not been any guesses yet.'
-                )
+        if not game.guesses:
+            return await ctx.send(
+                'There have not been any guesses yet.'
+            )
 
-            return await ctx.send('Guesses so far:', file=game.progress.to_discord_file())
+        return await ctx.send(**await self.renderer(ctx.message.channel).message(
+            game.progress, 'Guesses so far:'))
 
     @commands.command(aliases=['h'])
     async def hint(self, ctx: Context):
-        async with self.games.lock(ctx.message.channel):
-            game = await self.games.get_current_game(ctx.message.channel)
+        game = await self.games.get_current_game(ctx.message.channel)
 
-            return await ctx.send(
-                file=game.draw_unused_letters().to_discord_file()
-            )
+        return await ctx.send(**await self.renderer(ctx.message.channel).message(
+            game.draw_unused_letters()
+        ))
 
     @commands.command(aliases=['hh'])
     async def known_letters(self, ctx: Context):
-        async with self.games.lock(ctx.message.channel):
-            game = await self.games.get_current_game(ctx.message.channel)
-            return await ctx.send('Here\'s what you know:', file=game.draw_known_letters().to_discord_file())
+        game = await self.games.get_current_game(ctx.message.channel)
+        return await ctx.send(**await self.renderer(ctx.message.channel).message(
+            game.draw_known_letters(), 'Here\'s what you know:'))
+
+    @commands.command(aliases=['r'])
+    async def remaining(self, ctx: Context):
+        game = await self.games.get_current_game(ctx.message.channel)
+        count = await game.remaining()
+
+        if count == 1:
+            return await ctx.send('There is only 1 possible answer left.')
+
+        return await ctx.send(f'There are {count} possible answers left.')
 
     @commands.command()
     async def suggest(self, ctx: Context):
@@ -160,5 +183,5 @@ class Wordle(commands.Cog):
             )
 
         return await ctx.send(
-            f'Try this one: {game.suggest()}'
+            f'Try this one: {await game.suggest()}'
         )
@@ -1,67 +1,175 @@
 import os
 import sqlite3
+import sys
+import time
 from contextlib import closing
+from itertools import islice
 
 
 # TODO: Refactor this into more of true model, instead of one-off static methods
-from typing import Optional
+from typing import Iterator, Optional
 
 from Wordle.Word import Word
+from Wordle.WordDatabase import WordDatabase
+from Wordle.WordFile import WordFile
+from Wordle.WordFilter import WordFilter
+from Wordle.WordIndex import WordIndex
+from Wordle.WordSource import WordSource
 
 
 class Words:
     BASE_DIR: str = os.path.dirname(os.path.abspath(__file__))
     DATABASE: str = os.path.join(BASE_DIR, "../wordle.db")
     WORDLIST: str = os.path.join(BASE_DIR, "../wordlist.txt")
+    COMPILED: str = os.path.join(BASE_DIR, "../wordle.dict")
+
+    _source: Optional[WordSource] = None
+    _filter: Optional[WordFilter] = None
+
+    BATCH_SIZE: int = 10000
+    BULK_LOAD_PRAGMAS: list[str] = [
+        'journal_mode=OFF',
+        'synchronous=OFF',
+        'locking_mode=EXCLUSIVE',
+        'temp_store=MEMORY',
+        'cache_size=-65536']
 
     @staticmethod
-    def create_db():
-        with open(Words.DATABASE, "w"):
-            con = sqlite3.connect(Words.DATABASE)
+    def create_db(database: Optional[str] = None):
+        database = database or Words.DATABASE
+        with open(database, "w"):
+            con = sqlite3.connect(database)
             with closing(con.cursor()) as cur:
                 cur.execute('''
                     CREATE TABLE words (
                         word CHAR(25) NOT NULL,
-                        definition VARCHAR(255) NOT NULL  
+                        length INTEGER NOT NULL,
+                        definition VARCHAR(255) NOT NULL
                     );
                 ''')
             con.commit()
 
     @staticmethod
-    def seed():
-        con = sqlite3.connect(Words.DATABASE)
-        with closing(con.cursor()) as cur:
-            with open(Words.WORDLIST) as wordlist:
-                for line in wordlist:
-                    try:
-                        word, definition = line.split('	')
-                        cur.execute('INSERT INTO words VALUES(?,?)', (word.lower(), definition))
-                    except ValueError:
-                        continue
-        con.commit()
+    def read_wordlist(wordlist: Optional[str] = None) -> Iterator[tuple[str, int, str]]:
+        with open(wordlist or Words.WORDLIST) as lines:
+            for line in lines:
+                try:
+                    word, definition = line.split('\t')
+                except ValueError:
+                    continue
+
+                word = word.lower()
+                yield word, len(word), definition.replace('\n', '').strip()
+
+    @staticmethod
+    def seed(database: Optional[str] = None, wordlist: Optional[str] = None) -> int:
+        """ Bulk loads the wordlist in a single transaction, returns the row count """
+        con = sqlite3.connect(database or Words.DATABASE, isolation_level=None)
+        with closing(con), closing(con.cursor()) as cur:
+            for pragma in Words.BULK_LOAD_PRAGMAS:
+                cur.execute(f'PRAGMA {pragma}')
+
+            count = 0
+            rows = Words.read_wordlist(wordlist)
+
+            cur.execute('BEGIN')
+            while batch := list(islice(rows, Words.BATCH_SIZE)):
+                cur.executemany('INSERT INTO words VALUES(?,?,?)', batch)
+                count += len(batch)
+
+            cur.execute('CREATE INDEX IF NOT EXISTS words_word ON words (word)')
+            cur.execute('CREATE INDEX IF NOT EXISTS words_length ON words (length)')
+            cur.execute('COMMIT')
+
+        return count
+
+    @staticmethod
+    def rebuild(database: Optional[str] = None, wordlist: Optional[str] = None) -> int:
+        """ Seeds a fresh copy of the database and swaps it into place """
+        database = database or Words.DATABASE
+        staging = f'{database}.tmp'
+
+        Words.create_db(staging)
+        count = Words.seed(staging, wordlist)
+        os.replace(staging, database)
+
+        if database == Words.DATABASE and os.path.exists(Words.COMPILED):
+            Words.compile()
+
+        return count
+
+    @staticmethod
+    def compile() -> int:
+        return WordFile.compile(Words.DATABASE, Words.COMPILED)
+
+    @staticmethod
+    def load(source: str = 'index') -> WordSource:
+        if source == 'mmap':
+            if not os.path.exists(Words.COMPILED):
+                Words.compile()
+            Words._source = WordFile(Words.COMPILED)
+        elif source == 'sqlite':
+            Words._source = WordDatabase(Words.DATABASE)
+        else:
+            Words._source = WordIndex.from_database(Words.DATABASE)
+
+        return Words._source
+
+    @staticmethod
+    def load_filter(error_rate: float, path: Optional[str] = None) -> WordFilter:
+        """ Loads a prebuilt filter from path, (re)building it if missing or stale """
+        bloom = None
+        if path and os.path.exists(path):
+            bloom = WordFilter.load(path)
+
+        if bloom is None or bloom.count != len(Words.source()):
+            bloom = WordFilter.from_source(Words.source(), error_rate=error_rate)
+            if path:
+                bloom.save(path)
+
+        Words._filter = bloom
+        return bloom
+
+    @staticmethod
+    def filter() -> Optional[WordFilter]:
+        return Words._filter
+
+    @staticmethod
+    def source() -> WordSource:
+        if Words._source is None:
+            return Words.load()
+        return Words._source
+
+    @staticmethod
+    def rejected(word: str) -> bool:
+        """ Whether the filter proves word is not in the dictionary, without touching the source """
+        bloom = Words._filter
+        return bloom is not None and not bloom.might_contain(word.lower())
+
+    @staticmethod
+    def lookup(word: str) -> bool:
+        """ Checks the source alone, for words the filter has let through """
+        found = word.lower() in Words.source()
+        if Words._filter is not None and not found:
+            Words._filter.false_positives += 1
+
+        return found
+
+    @staticmethod
+    def contains(word: str) -> bool:
+        return not Words.rejected(word) and Words.lookup(word)
 
     @staticmethod
     def get_by_word(word: str) -> list[Word]:
-        con = sqlite3.connect(Words.DATABASE)
-        with closing(con.cursor()) as cur:
-            cur.execute(
-                'SELECT word, definition FROM words WHERE word=?',
-                (word.lower(),)
-            )
-            return [Words.__hydrate_word(row[0], row[1]) for row in cur.fetchall()]
+        return Words.source().get_by_word(word)
 
     @staticmethod
     def get_random(word_length: int = 5, count: int = 1) -> list[Word]:
-        con = sqlite3.connect(Words.DATABASE)
-        with closing(con.cursor()) as cur:
-            cur.execute(
-                'SELECT word, definition FROM words '
-                'WHERE LENGTH(word)=? ORDER BY RANDOM() LIMIT ?',
-                (word_length, count)
-            )
-            rows = cur.fetchall()
-            return [Word(word=row[0], definition=row[1]) for row in rows]
+        return Words.source().get_random(word_length, count)
 
-    @staticmethod
-    def __hydrate_word(word: str, definition: str) -> Word:
-        return Word(word, definition.replace('\n', '').strip())
+if __name__ == '__main__':
+    # Usage: python -m Wordle.Words [wordlist] [database]
+    started = time.perf_counter()
+    wordlist, database = (sys.argv[1:] + [None, None])[:2]
+    rows = Words.rebuild(database=database, wordlist=wordlist)
+    print(f'Seeded {rows} words in {time.perf_counter() - started:.2f}s')
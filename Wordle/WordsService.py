@@ -0,0 +1,85 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, TypeVar
+
+from Wordle.CandidateSet import CandidateSet
+from Wordle.Solver import History, Solver
+from Wordle.Word import Word
+from Wordle.WordDatabase import WordDatabase
+from Wordle.Words import Words
+
+T = TypeVar('T')
+
+
+class WordsService:
+    """
+    Async front for Words that keeps sqlite queries and solver work off
+    the event loop. The index and mmap sources answer faster than a thread
+    hop, so their lookups always run inline, as does the filter check
+    before any lookup. A pool size of 0 runs everything inline.
+    """
+
+    def __init__(self, pool_size: int = 4, solver_budget: float = 0.25, solver_sample_size: int = 2000):
+        self.pool_size: int = pool_size
+        self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix='words') if pool_size else None
+
+        self.solver_budget: float = solver_budget
+        self.solver_sample_size: int = solver_sample_size
+        self._solvers: Dict[int, Solver] = {}
+        self._solvers_lock = threading.Lock()
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        if self._executor is None:
+            return fn(*args)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(fn, *args))
+
+    async def _lookup(self, fn: Callable[..., T], *args) -> T:
+        if not isinstance(Words.source(), WordDatabase):
+            return fn(*args)
+
+        return await self._run(fn, *args)
+
+    async def contains(self, word: str) -> bool:
+        if Words.rejected(word):
+            return False
+
+        return await self._lookup(Words.lookup, word)
+
+    async def get_by_word(self, word: str) -> list[Word]:
+        return await self._lookup(Words.get_by_word, word)
+
+    async def get_random(self, word_length: int = 5, count: int = 1) -> list[Word]:
+        return await self._lookup(Words.get_random, word_length, count)
+
+    def solver(self, word_length: int) -> Solver:
+        with self._solvers_lock:
+            if word_length not in self._solvers:
+                self._solvers[word_length] = Solver(
+                    Words.source().words(word_length),
+                    latency_budget=self.solver_budget,
+                    sample_size=self.solver_sample_size)
+
+            return self._solvers[word_length]
+
+    async def candidates(self,
+                         word_length: int,
+                         history: History = (),
+                         current: Optional[CandidateSet] = None) -> CandidateSet:
+        return await self._run(
+            lambda: self.solver(word_length).candidates(history, current))
+
+    async def narrow(self, word_length: int, candidates: CandidateSet, guess: str, code: int) -> CandidateSet:
+        return await self._run(
+            lambda: self.solver(word_length).narrow(candidates, guess, code))
+
+    async def suggest(self, word_length: int, candidates: Optional[CandidateSet] = None) -> Optional[str]:
+        return await self._run(lambda: self.solver(word_length).suggest(candidates))
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)